@@ -27,9 +27,11 @@ if __name__ == "__main__":
     if args.input_file:
         print(f"Input file path: {args.input_file}")
         try:
-            with open(args.input_file, 'r') as f:
-                print("First line of the file:")
-                print(f.readline().strip())
+            # Only the first line is shown, so read at most 4 KiB of it
+            with open(args.input_file, 'rb') as f:
+                line = f.readline(4096).decode('utf-8', errors='replace')
+            print("First line of the file:")
+            print(line.strip())
         except Exception as e:
             print(f"Could not read the file: {e}")
 
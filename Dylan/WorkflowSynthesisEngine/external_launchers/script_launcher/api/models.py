@@ -2,13 +2,31 @@
 Pydantic models for API request and response validation.
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, Dict, Any, List, Union
+from typing_extensions import TypeAliasType
 
 
-class ScriptParameterModel(BaseModel):
+# JSON-compatible parameter values (nested lists allowed for multi-value params)
+ParamValue = TypeAliasType(
+    "ParamValue", Union[bool, int, float, str, None, List["ParamValue"]]
+)
+ParamDict = Dict[str, ParamValue]
+
+
+class APIModel(BaseModel):
+    """Base model for API payloads with a shared JSON serializer."""
+    model_config = ConfigDict(ser_json_timedelta='iso8601')
+
+    def to_json(self) -> str:
+        """Serialize to JSON with every schema field present, defaults and None included."""
+        return self.model_dump_json(by_alias=True)
+
+
+class ScriptParameterModel(APIModel):
     """Script parameter specification."""
+    model_config = ConfigDict(frozen=True)
+
     name: str
     type: str
     description: str
@@ -18,8 +36,22 @@ class ScriptParameterModel(BaseModel):
     min_value: Optional[float] = None
     max_value: Optional[float] = None
 
-
-class ScriptMetadataModel(BaseModel):
+    @classmethod
+    def from_param(cls, param) -> 'ScriptParameterModel':
+        """Build from a registry ScriptParameter without re-validating."""
+        return cls.model_construct(
+            name=param.name,
+            type=param.type,
+            description=param.description,
+            default=param.default,
+            required=param.required,
+            choices=param.choices,
+            min_value=param.min_value,
+            max_value=param.max_value
+        )
+
+
+class ScriptMetadataModel(APIModel):
     """Script metadata for API responses."""
     id: str
     name: str
@@ -42,8 +74,34 @@ class ScriptMetadataModel(BaseModel):
     failure_count: int = 0
     enabled: bool = True
 
-
-class RegisterScriptRequest(BaseModel):
+    @classmethod
+    def from_metadata(cls, script) -> 'ScriptMetadataModel':
+        """Build from registry ScriptMetadata without re-validating."""
+        return cls.model_construct(
+            id=script.id,
+            name=script.name,
+            path=script.path,
+            description=script.description,
+            parameters=[ScriptParameterModel.from_param(p) for p in script.parameters],
+            tags=script.tags,
+            author=script.author,
+            version=script.version,
+            python_version=script.python_version,
+            dependencies=script.dependencies,
+            timeout=script.timeout,
+            working_directory=script.working_directory,
+            environment_variables=script.environment_variables,
+            created_at=script.created_at,
+            updated_at=script.updated_at,
+            last_run=script.last_run,
+            run_count=script.run_count,
+            success_count=script.success_count,
+            failure_count=script.failure_count,
+            enabled=script.enabled
+        )
+
+
+class RegisterScriptRequest(APIModel):
     """Request to register a new script."""
     name: str = Field(..., description="Script name")
     path: str = Field(..., description="Absolute path to the script file")
@@ -57,32 +115,49 @@ class RegisterScriptRequest(BaseModel):
     environment_variables: Dict[str, str] = Field(default_factory=dict)
 
 
-class RegisterScriptResponse(BaseModel):
+class RegisterScriptResponse(APIModel):
     """Response after registering a script."""
     success: bool
     script_id: Optional[str] = None
     message: str
 
 
-class LaunchScriptRequest(BaseModel):
+class LaunchScriptRequest(APIModel):
     """Request to launch a script."""
     script_id: str = Field(..., description="ID of the script to launch")
-    parameters: Dict[str, Any] = Field(default_factory=dict, description="Parameter values")
+    parameters: ParamDict = Field(default_factory=dict, description="Parameter values")
     async_mode: bool = Field(default=False, description="Execute in background")
 
 
-class ExecutionMetricsModel(BaseModel):
-    """Execution metrics."""
+class ExecutionMetricsModel(APIModel):
+    """Aggregated execution metrics (raw samples stay server-side)."""
+    model_config = ConfigDict(frozen=True)
+
     start_time: float
     end_time: Optional[float] = None
     duration: Optional[float] = None
-    cpu_percent: List[float] = []
-    memory_mb: List[float] = []
     peak_memory_mb: float = 0.0
+    avg_cpu_percent: float = 0.0
+    cpu_samples: int = 0
     exit_code: Optional[int] = None
 
-
-class ExecutionResultModel(BaseModel):
+    @classmethod
+    def from_metrics(cls, metrics) -> Optional['ExecutionMetricsModel']:
+        """Build from monitor ExecutionMetrics without re-validating."""
+        if metrics is None:
+            return None
+        return cls.model_construct(
+            start_time=metrics.start_time,
+            end_time=metrics.end_time,
+            duration=metrics.duration,
+            peak_memory_mb=metrics.peak_memory_mb,
+            avg_cpu_percent=metrics.avg_cpu_percent,
+            cpu_samples=metrics.cpu_samples,
+            exit_code=metrics.exit_code
+        )
+
+
+class ExecutionResultModel(APIModel):
     """Execution result."""
     status: str
     exit_code: Optional[int]
@@ -91,8 +166,20 @@ class ExecutionResultModel(BaseModel):
     metrics: Optional[ExecutionMetricsModel] = None
     error_message: Optional[str] = None
 
+    @classmethod
+    def from_result(cls, result) -> 'ExecutionResultModel':
+        """Build from an engine ExecutionResult without re-validating."""
+        return cls.model_construct(
+            status=result.status.value,
+            exit_code=result.exit_code,
+            stdout=result.stdout,
+            stderr=result.stderr,
+            metrics=ExecutionMetricsModel.from_metrics(result.metrics),
+            error_message=result.error_message
+        )
 
-class LaunchScriptResponse(BaseModel):
+
+class LaunchScriptResponse(APIModel):
     """Response after launching a script."""
     success: bool
     result: Optional[ExecutionResultModel] = None
@@ -100,37 +187,54 @@ class LaunchScriptResponse(BaseModel):
     message: str
 
 
-class QuickLaunchRequest(BaseModel):
+class QuickLaunchRequest(APIModel):
     """Request to quick launch a script without registration."""
     script_path: str = Field(..., description="Path to the script file")
     args: List[str] = Field(default_factory=list, description="Command-line arguments")
 
 
-class ScriptListResponse(BaseModel):
+class ScriptListResponse(APIModel):
     """Response with list of scripts."""
     scripts: List[ScriptMetadataModel]
     total: int
 
 
-class ExecutionHistoryItem(BaseModel):
+class ExecutionHistoryItem(APIModel):
     """Single execution history item."""
+    model_config = ConfigDict(frozen=True)
+
     script_id: str
     script_name: str
-    parameters: Dict[str, Any]
+    parameters: ParamDict
     status: str
     exit_code: Optional[int]
     duration: Optional[float]
     timestamp: str
 
-
-class ExecutionHistoryResponse(BaseModel):
+    @classmethod
+    def from_record(cls, record) -> 'ExecutionHistoryItem':
+        """Build from an engine ExecutionRecord without re-validating."""
+        return cls.model_construct(
+            script_id=record.script_id,
+            script_name=record.script_name,
+            parameters=record.parameters,
+            status=record.status,
+            exit_code=record.exit_code,
+            duration=record.duration,
+            timestamp=record.timestamp
+        )
+
+
+class ExecutionHistoryResponse(APIModel):
     """Response with execution history."""
     history: List[ExecutionHistoryItem]
     total: int
 
 
-class StatusResponse(BaseModel):
+class StatusResponse(APIModel):
     """API status response."""
+    model_config = ConfigDict(frozen=True)
+
     status: str
     version: str
     total_scripts: int
@@ -138,30 +242,47 @@ class StatusResponse(BaseModel):
     uptime: float
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(APIModel):
     """Error response."""
+    model_config = ConfigDict(frozen=True)
+
     error: str
     detail: Optional[str] = None
 
 
-class ParameterPresetRequest(BaseModel):
+class ParameterPresetRequest(APIModel):
     """Request to save parameter preset."""
     preset_name: str
     script_id: str
-    values: Dict[str, Any]
+    values: ParamDict
 
 
-class ParameterPresetResponse(BaseModel):
+class ParameterPresetResponse(APIModel):
     """Response for parameter preset operations."""
     success: bool
     message: str
     presets: Optional[List[str]] = None
 
 
-class WebSocketMessage(BaseModel):
-    """WebSocket message format."""
-    type: str  # 'output', 'status', 'error', 'complete'
-    stream: Optional[str] = None  # 'stdout' or 'stderr'
-    data: str
-    timestamp: str = Field(default_factory=lambda: datetime.now().isoformat())
+class ScheduleJobModel(APIModel):
+    """One job in a batch schedule request."""
+    job_id: str = Field(..., description="Unique job identifier")
+    name: str = Field(..., description="Human-readable job name")
+    script_id: str = Field(..., description="Script to execute")
+    parameters: ParamDict = Field(default_factory=dict, description="Parameter values")
+    trigger_type: str = Field(..., description="'cron', 'interval' or 'date'")
+    trigger_args: Dict[str, Any] = Field(
+        ..., description="Trigger fields, e.g. {'minutes': 5} or {'run_date': '2030-01-01T09:00:00'}"
+    )
 
+
+class ScheduleBatchRequest(APIModel):
+    """Request to schedule several jobs at once."""
+    jobs: List[ScheduleJobModel]
+
+
+class ScheduleBatchResponse(APIModel):
+    """Response after scheduling a batch of jobs."""
+    success: bool
+    job_ids: List[str]
+    message: str
@@ -2,42 +2,57 @@
 FastAPI-based REST API for coding agent access to the script launcher.
 """
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Optional, List
+from fastapi.responses import ORJSONResponse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from pydantic import ValidationError
+from typing import Dict, Optional, Type, TypeVar
+import os
 import time
 import asyncio
 from datetime import datetime
 
 from .models import (
+    APIModel,
     RegisterScriptRequest, RegisterScriptResponse,
     LaunchScriptRequest, LaunchScriptResponse,
-    QuickLaunchRequest, ExecutionResultModel, ExecutionMetricsModel,
-    ScriptListResponse, ScriptMetadataModel, ScriptParameterModel,
+    QuickLaunchRequest, ExecutionResultModel,
+    ScriptListResponse, ScriptMetadataModel,
     ExecutionHistoryResponse, ExecutionHistoryItem,
     StatusResponse, ErrorResponse,
     ParameterPresetRequest, ParameterPresetResponse,
-    WebSocketMessage
+    ScheduleBatchRequest, ScheduleBatchResponse
 )
 
-import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent))
-
 from core.launcher_engine import get_engine
 from core.script_registry import ScriptMetadata, ScriptParameter, get_registry
 from core.parameter_manager import ParameterManager
+from core.scheduler import get_scheduler
 from core.logger import get_logger
 
 logger = get_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """On shutdown, stop the launch executor without waiting on running scripts."""
+    yield
+    launch_executor.shutdown(wait=False, cancel_futures=True)
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Script Launcher API",
     description="Production-ready API for launching and managing Python scripts",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -55,20 +70,83 @@ registry = get_registry()
 param_manager = ParameterManager()
 start_time = time.time()
 
-# WebSocket connections
-websocket_connections: List[WebSocket] = []
+# Synchronous launches block on the child process, so run them off the event loop
+launch_executor = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 4),
+    thread_name_prefix="launch"
+)
+
+
+ModelT = TypeVar("ModelT", bound=APIModel)
+
+
+async def _parse_body(request: Request, model: Type[ModelT]) -> ModelT:
+    """Parse and validate a JSON request body in a single pass."""
+    try:
+        return model.model_validate_json(await request.body())
+    except ValidationError as e:
+        # Same shape as FastAPI's own body errors: loc starts with "body"
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+
+
+# Component schemas for bodies read from the raw Request, merged into /openapi.json
+_REF_TEMPLATE = "#/components/schemas/{model}"
+_body_components: Dict[str, dict] = {}
+
+
+def _body_schema(model: Type[APIModel]) -> dict:
+    """Document a raw-Request route's JSON body, since FastAPI can't see the model."""
+    schema = model.model_json_schema(ref_template=_REF_TEMPLATE)
+    _body_components.update(schema.pop("$defs", {}))
+    _body_components[model.__name__] = schema
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": {"$ref": _REF_TEMPLATE.format(model=model.__name__)}}
+            }
+        }
+    }
+
+
+def _openapi() -> dict:
+    """Generate the OpenAPI schema once, adding the raw-Request body components."""
+    if app.openapi_schema is None:
+        schema = _default_openapi()
+        components = schema.setdefault("components", {}).setdefault("schemas", {})
+        for name, component in _body_components.items():
+            components.setdefault(name, component)
+    return app.openapi_schema
+
+
+_default_openapi = app.openapi
+app.openapi = _openapi
+
+
+def _json_response(model: APIModel) -> Response:
+    """Serialize a response model directly, skipping FastAPI's re-encoding pass."""
+    return Response(content=model.to_json(), media_type="application/json")
+
+
+async def _run_blocking(func, *args, **kwargs):
+    """Run a blocking engine call on the launch executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(launch_executor, partial(func, *args, **kwargs))
 
 
 @app.get("/", response_model=StatusResponse)
 async def root():
     """API status and information."""
-    return StatusResponse(
+    # Fields are all trusted ints/floats, so skip validation
+    return _json_response(StatusResponse.model_construct(
         status="running",
         version="1.0.0",
-        total_scripts=len(registry.get_all_scripts()),
-        active_executions=len(engine.get_active_executions()),
+        total_scripts=registry.count(),
+        active_executions=engine.active_count(),
         uptime=time.time() - start_time
-    )
+    ))
 
 
 @app.get("/health")
@@ -77,9 +155,14 @@ async def health_check():
     return {"status": "healthy", "timestamp": datetime.now().isoformat()}
 
 
-@app.post("/scripts/register", response_model=RegisterScriptResponse)
-async def register_script(request: RegisterScriptRequest):
+@app.post(
+    "/scripts/register",
+    response_model=RegisterScriptResponse,
+    openapi_extra=_body_schema(RegisterScriptRequest)
+)
+async def register_script(raw_request: Request):
     """Register a new script."""
+    request = await _parse_body(raw_request, RegisterScriptRequest)
     try:
         # Convert request to ScriptMetadata
         parameters = [
@@ -112,18 +195,18 @@ async def register_script(request: RegisterScriptRequest):
         
         script_id = registry.register_script(metadata)
         
-        return RegisterScriptResponse(
+        return _json_response(RegisterScriptResponse(
             success=True,
             script_id=script_id,
             message=f"Script registered successfully: {request.name}"
-        )
+        ))
     
     except Exception as e:
         logger.error(f"Failed to register script: {e}")
-        return RegisterScriptResponse(
+        return _json_response(RegisterScriptResponse(
             success=False,
             message=f"Failed to register script: {str(e)}"
-        )
+        ))
 
 
 @app.get("/scripts", response_model=ScriptListResponse)
@@ -132,51 +215,14 @@ async def list_scripts(enabled_only: bool = False, tag: Optional[str] = None):
     if tag:
         scripts = registry.get_scripts_by_tag(tag)
     elif enabled_only:
-        scripts = registry.get_enabled_scripts()
+        # Filter lazily so the conversion below is the only pass over the scripts
+        scripts = registry.iter_enabled_scripts()
     else:
-        scripts = registry.get_all_scripts()
+        scripts = registry.scripts_snapshot()
     
-    # Convert to response models
-    script_models = []
-    for script in scripts:
-        params = [
-            ScriptParameterModel(
-                name=p.name,
-                type=p.type,
-                description=p.description,
-                default=p.default,
-                required=p.required,
-                choices=p.choices,
-                min_value=p.min_value,
-                max_value=p.max_value
-            )
-            for p in script.parameters
-        ]
-        
-        script_models.append(ScriptMetadataModel(
-            id=script.id,
-            name=script.name,
-            path=script.path,
-            description=script.description,
-            parameters=params,
-            tags=script.tags,
-            author=script.author,
-            version=script.version,
-            python_version=script.python_version,
-            dependencies=script.dependencies,
-            timeout=script.timeout,
-            working_directory=script.working_directory,
-            environment_variables=script.environment_variables,
-            created_at=script.created_at,
-            updated_at=script.updated_at,
-            last_run=script.last_run,
-            run_count=script.run_count,
-            success_count=script.success_count,
-            failure_count=script.failure_count,
-            enabled=script.enabled
-        ))
+    script_models = [ScriptMetadataModel.from_metadata(script) for script in scripts]
     
-    return ScriptListResponse(scripts=script_models, total=len(script_models))
+    return _json_response(ScriptListResponse(scripts=script_models, total=len(script_models)))
 
 
 @app.get("/scripts/{script_id}", response_model=ScriptMetadataModel)
@@ -186,42 +232,7 @@ async def get_script(script_id: str):
     if not script:
         raise HTTPException(status_code=404, detail=f"Script not found: {script_id}")
     
-    params = [
-        ScriptParameterModel(
-            name=p.name,
-            type=p.type,
-            description=p.description,
-            default=p.default,
-            required=p.required,
-            choices=p.choices,
-            min_value=p.min_value,
-            max_value=p.max_value
-        )
-        for p in script.parameters
-    ]
-    
-    return ScriptMetadataModel(
-        id=script.id,
-        name=script.name,
-        path=script.path,
-        description=script.description,
-        parameters=params,
-        tags=script.tags,
-        author=script.author,
-        version=script.version,
-        python_version=script.python_version,
-        dependencies=script.dependencies,
-        timeout=script.timeout,
-        working_directory=script.working_directory,
-        environment_variables=script.environment_variables,
-        created_at=script.created_at,
-        updated_at=script.updated_at,
-        last_run=script.last_run,
-        run_count=script.run_count,
-        success_count=script.success_count,
-        failure_count=script.failure_count,
-        enabled=script.enabled
-    )
+    return _json_response(ScriptMetadataModel.from_metadata(script))
 
 
 @app.delete("/scripts/{script_id}")
@@ -244,43 +255,29 @@ async def toggle_script(script_id: str):
     return {"success": True, "enabled": enabled}
 
 
-@app.post("/launch", response_model=LaunchScriptResponse)
-async def launch_script(request: LaunchScriptRequest):
+@app.post(
+    "/launch",
+    response_model=LaunchScriptResponse,
+    openapi_extra=_body_schema(LaunchScriptRequest)
+)
+async def launch_script(raw_request: Request):
     """Launch a registered script."""
+    request = await _parse_body(raw_request, LaunchScriptRequest)
     try:
-        result = engine.launch_script(
+        result = await _run_blocking(
+            engine.launch_script,
             script_id=request.script_id,
             parameters=request.parameters,
             async_mode=request.async_mode
         )
         
-        # Convert result to response model
-        metrics_model = None
-        if result.metrics:
-            metrics_model = ExecutionMetricsModel(
-                start_time=result.metrics.start_time,
-                end_time=result.metrics.end_time,
-                duration=result.metrics.duration,
-                cpu_percent=result.metrics.cpu_percent,
-                memory_mb=result.metrics.memory_mb,
-                peak_memory_mb=result.metrics.peak_memory_mb,
-                exit_code=result.metrics.exit_code
-            )
-        
-        result_model = ExecutionResultModel(
-            status=result.status.value,
-            exit_code=result.exit_code,
-            stdout=result.stdout,
-            stderr=result.stderr,
-            metrics=metrics_model,
-            error_message=result.error_message
-        )
+        result_model = ExecutionResultModel.from_result(result)
         
-        return LaunchScriptResponse(
+        return _json_response(LaunchScriptResponse(
             success=result.is_success(),
             result=result_model,
             message="Script launched successfully"
-        )
+        ))
     
     except Exception as e:
         logger.error(f"Failed to launch script: {e}")
@@ -291,37 +288,19 @@ async def launch_script(request: LaunchScriptRequest):
 async def quick_launch(request: QuickLaunchRequest):
     """Quick launch a script without registration."""
     try:
-        result = engine.quick_launch(
+        result = await _run_blocking(
+            engine.quick_launch,
             script_path=request.script_path,
             args=request.args
         )
         
-        metrics_model = None
-        if result.metrics:
-            metrics_model = ExecutionMetricsModel(
-                start_time=result.metrics.start_time,
-                end_time=result.metrics.end_time,
-                duration=result.metrics.duration,
-                cpu_percent=result.metrics.cpu_percent,
-                memory_mb=result.metrics.memory_mb,
-                peak_memory_mb=result.metrics.peak_memory_mb,
-                exit_code=result.metrics.exit_code
-            )
-        
-        result_model = ExecutionResultModel(
-            status=result.status.value,
-            exit_code=result.exit_code,
-            stdout=result.stdout,
-            stderr=result.stderr,
-            metrics=metrics_model,
-            error_message=result.error_message
-        )
+        result_model = ExecutionResultModel.from_result(result)
         
-        return LaunchScriptResponse(
+        return _json_response(LaunchScriptResponse(
             success=result.is_success(),
             result=result_model,
             message="Script executed successfully"
-        )
+        ))
     
     except Exception as e:
         logger.error(f"Failed to quick launch script: {e}")
@@ -331,22 +310,9 @@ async def quick_launch(request: QuickLaunchRequest):
 @app.get("/history", response_model=ExecutionHistoryResponse)
 async def get_history(limit: int = 100):
     """Get execution history."""
-    history = engine.get_execution_history(limit=limit)
-    
-    items = [
-        ExecutionHistoryItem(
-            script_id=h['script_id'],
-            script_name=h['script_name'],
-            parameters=h['parameters'],
-            status=h['status'],
-            exit_code=h['exit_code'],
-            duration=h['duration'],
-            timestamp=h['timestamp']
-        )
-        for h in history
-    ]
+    items = [ExecutionHistoryItem.from_record(r) for r in engine.get_execution_records(limit=limit)]
     
-    return ExecutionHistoryResponse(history=items, total=len(items))
+    return _json_response(ExecutionHistoryResponse(history=items, total=len(items)))
 
 
 @app.get("/executions/active")
@@ -375,21 +341,21 @@ async def save_preset(request: ParameterPresetRequest):
         request.values
     )
     
-    return ParameterPresetResponse(
+    return _json_response(ParameterPresetResponse(
         success=success,
         message="Preset saved successfully" if success else "Failed to save preset"
-    )
+    ))
 
 
 @app.get("/presets/{script_id}", response_model=ParameterPresetResponse)
 async def list_presets(script_id: str):
     """List available presets for a script."""
     presets = param_manager.list_presets(script_id)
-    return ParameterPresetResponse(
+    return _json_response(ParameterPresetResponse(
         success=True,
         message=f"Found {len(presets)} presets",
         presets=presets
-    )
+    ))
 
 
 @app.get("/presets/{script_id}/{preset_name}")
@@ -402,6 +368,21 @@ async def load_preset(script_id: str, preset_name: str):
     return {"success": True, "values": values}
 
 
+@app.post("/schedules/batch", response_model=ScheduleBatchResponse)
+async def schedule_batch(request: ScheduleBatchRequest):
+    """Schedule several jobs at once, stamped with one shared creation time."""
+    try:
+        job_ids = get_scheduler().schedule_batch([job.model_dump() for job in request.jobs])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return _json_response(ScheduleBatchResponse(
+        success=True,
+        job_ids=job_ids,
+        message=f"Scheduled {len(job_ids)} jobs"
+    ))
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
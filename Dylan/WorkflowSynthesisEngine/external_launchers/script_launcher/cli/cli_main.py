@@ -11,10 +11,12 @@ from rich.live import Live
 from rich.layout import Layout
 from rich.text import Text
 import sys
-from pathlib import Path
 import json
+from pathlib import Path
 
-sys.path.append(str(Path(__file__).parent.parent))
+if __name__ == '__main__':
+    # Run directly, sys.path[0] is cli/; main.py already puts the root on the path
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from core import (
     get_engine, get_registry, ScriptMetadata, ScriptParameter,
@@ -261,9 +263,8 @@ def launch(script_id, param, preset, async_mode, no_output):
   Exit Code: {result.exit_code}
   Peak Memory: {result.metrics.peak_memory_mb:.1f} MB
 """
-            if result.metrics.cpu_percent:
-                avg_cpu = sum(result.metrics.cpu_percent) / len(result.metrics.cpu_percent)
-                metrics_text += f"  Avg CPU: {avg_cpu:.1f}%\n"
+            if result.metrics.cpu_samples:
+                metrics_text += f"  Avg CPU: {result.metrics.avg_cpu_percent:.1f}%\n"
             
             console.print(Panel(metrics_text, border_style="cyan"))
         
@@ -345,16 +346,27 @@ def interactive():
 
 
 @cli.command()
-def api():
+@click.option('--workers', default=1, show_default=True,
+              help='Number of worker processes (execution history and active runs are per worker)')
+def api(workers):
     """Start the REST API server."""
     console.print("[cyan]Starting API server...[/cyan]")
     console.print("[green]API will be available at:[/green] http://localhost:8000")
     console.print("[green]API documentation:[/green] http://localhost:8000/docs")
     
     import uvicorn
-    from api.rest_api import app
     
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop/httptools are picked up automatically when installed (uvicorn[standard])
+    if workers > 1:
+        # Multiple workers need an import string so each process loads its own app;
+        # app_dir puts the package root on sys.path however the CLI was launched
+        uvicorn.run(
+            "api.rest_api:app", host="0.0.0.0", port=8000, workers=workers,
+            app_dir=str(Path(__file__).resolve().parent.parent)
+        )
+    else:
+        from api.rest_api import app
+        uvicorn.run(app, host="0.0.0.0", port=8000)
 
 
 @cli.command()
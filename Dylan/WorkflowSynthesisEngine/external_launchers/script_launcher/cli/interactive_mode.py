@@ -9,11 +9,8 @@ from rich.panel import Panel
 from rich.live import Live
 from rich.layout import Layout
 from rich.text import Text
-import sys
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).parent.parent))
-
 from core import get_engine, get_registry, ParameterManager
 
 console = Console()
@@ -2,12 +2,19 @@
 Execution monitor for real-time process tracking, output streaming, and status management.
 """
 
+import os
+import selectors
+import shutil
 import subprocess
+import sys
+import tempfile
 import threading
 import queue
 import time
 import psutil
-from typing import Optional, Callable, Dict, Any, List
+from typing import Optional, Callable, Dict, Any, List, Tuple, Deque, IO, Union
+from collections import deque
+from functools import lru_cache
 from datetime import datetime
 from enum import Enum
 from dataclasses import dataclass, field
@@ -29,22 +36,48 @@ class ExecutionStatus(Enum):
 
 @dataclass
 class ExecutionMetrics:
-    """Metrics collected during script execution."""
+    """Metrics collected during script execution, aggregated as samples arrive."""
     start_time: float = field(default_factory=time.time)
     end_time: Optional[float] = None
     duration: Optional[float] = None
-    cpu_percent: List[float] = field(default_factory=list)
-    memory_mb: List[float] = field(default_factory=list)
+    sum_cpu: float = 0.0
+    sum_mem: float = 0.0
+    n_samples: int = 0
     peak_memory_mb: float = 0.0
     exit_code: Optional[int] = None
     
+    def add_sample(self, cpu: float, mem: float):
+        """Fold one CPU (%) / memory (MB) sample into the running totals."""
+        self.sum_cpu += cpu
+        self.sum_mem += mem
+        self.n_samples += 1
+        if mem > self.peak_memory_mb:
+            self.peak_memory_mb = mem
+    
     def finalize(self):
         """Finalize metrics after execution."""
         if self.end_time is None:
             self.end_time = time.time()
         self.duration = self.end_time - self.start_time
-        if self.memory_mb:
-            self.peak_memory_mb = max(self.memory_mb)
+    
+    @property
+    def cpu_samples(self) -> int:
+        """Number of CPU samples collected."""
+        return self.n_samples
+    
+    @property
+    def avg_cpu_percent(self) -> float:
+        """Average CPU usage over all samples."""
+        if not self.n_samples:
+            return 0.0
+        return self.sum_cpu / self.n_samples
+    
+    @property
+    def avg_memory_mb(self) -> float:
+        """Average memory usage over all samples."""
+        if not self.n_samples:
+            return 0.0
+        return self.sum_mem / self.n_samples
 
 
 @dataclass
@@ -65,85 +98,294 @@ class ExecutionResult:
 class OutputStreamHandler:
     """Handles real-time output streaming from subprocess."""
     
-    def __init__(self, process: subprocess.Popen):
+    # Bytes requested per read from a ready pipe
+    READ_CHUNK = 65536
+    
+    # Lines kept in memory per stream; older lines spill to a temp file
+    MAX_LINES = 100_000
+    SPILL_BUFFER = 1 << 20
+    
+    def __init__(
+        self,
+        process: subprocess.Popen,
+        max_lines: int = MAX_LINES,
+        queue_output: bool = True
+    ):
         self.process = process
-        self.stdout_lines: List[str] = []
-        self.stderr_lines: List[str] = []
-        self.output_queue = queue.Queue()
+        self.max_lines = max_lines
+        self.stdout_lines: Deque[str] = deque(maxlen=max_lines)
+        self.stderr_lines: Deque[str] = deque(maxlen=max_lines)
+        self._spill: Dict[str, IO[bytes]] = {}
+        self._spill_lock = threading.Lock()
+        self._closed = False
+        # (stream_name, [lines]) batches for polling consumers; without one,
+        # the queue would only hold a second copy of every line
+        self.output_queue: Optional[queue.Queue] = queue.Queue() if queue_output else None
         self.callbacks: List[Callable[[str, str], None]] = []
         self._stop_event = threading.Event()
         
-        # Start output reader threads
-        self.stdout_thread = threading.Thread(
-            target=self._read_stream,
-            args=(process.stdout, 'stdout'),
-            daemon=True
-        )
-        self.stderr_thread = threading.Thread(
-            target=self._read_stream,
-            args=(process.stderr, 'stderr'),
-            daemon=True
-        )
+        if os.name == 'posix':
+            # One thread multiplexes both pipes and reads them in bulk
+            self._threads = [threading.Thread(target=self._read_loop, daemon=True)]
+        else:
+            # select() only works on sockets on Windows, so read each pipe on its own thread
+            self._threads = [
+                threading.Thread(target=self._read_stream, args=(process.stdout, 'stdout'), daemon=True),
+                threading.Thread(target=self._read_stream, args=(process.stderr, 'stderr'), daemon=True)
+            ]
         
-        self.stdout_thread.start()
-        self.stderr_thread.start()
+        for thread in self._threads:
+            thread.start()
+    
+    def _read_loop(self):
+        """Read both pipes from a single selector loop."""
+        selector = selectors.DefaultSelector()
+        residual: Dict[str, bytes] = {}
+        for stream, stream_name in ((self.process.stdout, 'stdout'), (self.process.stderr, 'stderr')):
+            os.set_blocking(stream.fileno(), False)
+            selector.register(stream.fileno(), selectors.EVENT_READ, stream_name)
+            residual[stream_name] = b''
+        
+        try:
+            while selector.get_map() and not self._stop_event.is_set():
+                for key, _ in selector.select(timeout=0.1):
+                    stream_name = key.data
+                    try:
+                        chunk = os.read(key.fd, self.READ_CHUNK)
+                    except BlockingIOError:
+                        continue
+                    
+                    if not chunk:
+                        # EOF: flush any unterminated last line
+                        selector.unregister(key.fd)
+                        if residual[stream_name]:
+                            self._emit(stream_name, residual[stream_name])
+                        continue
+                    
+                    residual[stream_name] = self._feed(stream_name, residual[stream_name], chunk)
+        
+        except Exception as e:
+            logger.error("Error reading output: %s", e)
+        
+        finally:
+            selector.close()
     
     def _read_stream(self, stream, stream_name: str):
-        """Read from a stream and queue output."""
+        """Read one stream in bulk on its own thread (platforms without pipe select)."""
+        residual = b''
         try:
-            for line in iter(stream.readline, ''):
-                if self._stop_event.is_set():
+            while not self._stop_event.is_set():
+                chunk = stream.read1(self.READ_CHUNK)
+                if not chunk:
                     break
-                
-                line = line.rstrip('\n\r')
-                if not line:
-                    continue
-                
-                # Store line
-                if stream_name == 'stdout':
-                    self.stdout_lines.append(line)
-                else:
-                    self.stderr_lines.append(line)
-                
-                # Queue for real-time processing
-                self.output_queue.put((stream_name, line))
-                
-                # Call callbacks
-                for callback in self.callbacks:
-                    try:
-                        callback(stream_name, line)
-                    except Exception as e:
-                        logger.error(f"Output callback error: {e}")
+                residual = self._feed(stream_name, residual, chunk)
+            
+            if residual:
+                self._emit(stream_name, residual)
         
         except Exception as e:
-            logger.error(f"Error reading {stream_name}: {e}")
+            logger.error("Error reading %s: %s", stream_name, e)
+    
+    def _feed(self, stream_name: str, residual: bytes, chunk: bytes) -> bytes:
+        """Emit the complete lines in residual + chunk and return the unterminated rest."""
+        data = residual + chunk
+        end = data.rfind(b'\n')
+        if end < 0:
+            return data
+        self._emit(stream_name, data[:end])
+        return data[end + 1:]
+    
+    def _emit(self, stream_name: str, data: bytes):
+        """Decode a block of complete lines once and dispatch them."""
+        text = data.decode('utf-8', errors='replace')
+        self._dispatch(stream_name, [line.rstrip('\r') for line in text.split('\n')])
+    
+    def _dispatch(self, stream_name: str, lines: List[str]):
+        """Store, queue, and report a batch of lines, skipping blank ones."""
+        lines = [line for line in lines if line]
+        if not lines:
+            return
+        
+        self._store(stream_name, lines)
+        if self.output_queue is not None:
+            self.output_queue.put((stream_name, lines))
+        
+        # Callbacks drive live displays, so they still see every line
+        for callback in self.callbacks:
+            for line in lines:
+                try:
+                    callback(stream_name, line)
+                except Exception as e:
+                    logger.error("Output callback error: %s", e)
+    
+    def _store(self, stream_name: str, lines: List[str]):
+        """Append lines to the in-memory tail, spilling evicted lines to disk."""
+        buffer = self.stdout_lines if stream_name == 'stdout' else self.stderr_lines
+        overflow = len(buffer) + len(lines) - self.max_lines
+        if overflow > 0:
+            evicted = [buffer.popleft() for _ in range(min(overflow, len(buffer)))]
+            evicted.extend(lines[:overflow - len(evicted)])
+            with self._spill_lock:
+                # After close() the files are gone; late evictions are dropped
+                if not self._closed:
+                    spill = self._spill.get(stream_name)
+                    if spill is None:
+                        spill = tempfile.TemporaryFile('w+b', buffering=self.SPILL_BUFFER)
+                        self._spill[stream_name] = spill
+                    spill.write('\n'.join(evicted).encode('utf-8'))
+                    spill.write(b'\n')
+        buffer.extend(lines)
+    
+    def _joined(self, stream_name: str) -> str:
+        """Join a stream's spilled lines and in-memory tail."""
+        tail = '\n'.join(self.stdout_lines if stream_name == 'stdout' else self.stderr_lines)
+        with self._spill_lock:
+            spill = self._spill.get(stream_name)
+            if spill is None:
+                return tail
+            spill.flush()
+            spill.seek(0)
+            head = spill.read().decode('utf-8', errors='replace')
+            spill.seek(0, os.SEEK_END)
+        return head + tail if tail else head.rstrip('\n')
     
     def add_callback(self, callback: Callable[[str, str], None]):
         """Add a callback for real-time output."""
         self.callbacks.append(callback)
     
-    def get_output(self, timeout: float = 0.1) -> Optional[tuple]:
-        """Get next output line from queue."""
+    def get_output(self, timeout: float = 0.1) -> Optional[Tuple[str, List[str]]]:
+        """Get the next (stream_name, lines) batch from the queue."""
+        if self.output_queue is None:
+            return None
         try:
             return self.output_queue.get(timeout=timeout)
         except queue.Empty:
             return None
     
+    def join(self, timeout: Optional[float] = None):
+        """Wait for the reader threads to drain the pipes."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+    
     def stop(self):
         """Stop reading output."""
         self._stop_event.set()
     
     def get_full_output(self) -> tuple:
         """Get complete stdout and stderr."""
-        return '\n'.join(self.stdout_lines), '\n'.join(self.stderr_lines)
+        return self._joined('stdout'), self._joined('stderr')
+    
+    def close(self):
+        """Stop reading and delete the spill files; spilled lines are dropped."""
+        self._stop_event.set()
+        with self._spill_lock:
+            self._closed = True
+            for spill in self._spill.values():
+                spill.close()
+            self._spill.clear()
+
+
+class _PsutilSampler:
+    """Samples CPU and memory through psutil (all platforms)."""
+    
+    __slots__ = ("_process",)
+    
+    def __init__(self, pid: int):
+        self._process = psutil.Process(pid)
+        # Non-blocking CPU readings are deltas since the previous call,
+        # so the first one only sets the baseline
+        self._process.cpu_percent(interval=None)
+    
+    def sample(self) -> Tuple[float, float]:
+        """Return (cpu_percent, rss_mb) since the previous sample."""
+        # Read /proc once for both metrics
+        with self._process.oneshot():
+            cpu = self._process.cpu_percent(interval=None)
+            mem = self._process.memory_info().rss / (1024 * 1024)  # MB
+        return cpu, mem
+    
+    def close(self):
+        pass
+
+
+class _LinuxFastSampler:
+    """Samples CPU and memory by reading /proc/<pid>/stat and statm directly."""
+    
+    __slots__ = ("_stat", "_statm", "_clk_tck", "_page_mb", "_last_ticks", "_last_time")
+    
+    def __init__(self, pid: int):
+        self._stat = open(f"/proc/{pid}/stat", 'rb', buffering=0)
+        self._statm = None
+        try:
+            self._statm = open(f"/proc/{pid}/statm", 'rb', buffering=0)
+            self._clk_tck = os.sysconf('SC_CLK_TCK')
+            self._page_mb = os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+            self._last_ticks = self._read_ticks()
+        except Exception:
+            self.close()
+            raise
+        self._last_time = time.monotonic()
+    
+    @staticmethod
+    def _read(f) -> bytes:
+        """Re-read an open /proc file, raising ProcessLookupError once the process is gone."""
+        try:
+            f.seek(0)
+            data = f.read()
+        except OSError as e:
+            # ESRCH once the process has been reaped
+            raise ProcessLookupError(str(e)) from e
+        if not data:
+            raise ProcessLookupError("process exited")
+        return data
+    
+    def _read_ticks(self) -> int:
+        """Read utime + stime in clock ticks."""
+        data = self._read(self._stat)
+        # comm (field 2) may contain spaces, so split after its closing paren;
+        # utime and stime are fields 14 and 15
+        fields = data[data.rfind(b')') + 2:].split()
+        return int(fields[11]) + int(fields[12])
+    
+    def sample(self) -> Tuple[float, float]:
+        """Return (cpu_percent, rss_mb) since the previous sample."""
+        ticks = self._read_ticks()
+        now = time.monotonic()
+        
+        # Subtract in integer ticks; convert to float only for the ratio
+        delta_ticks = ticks - self._last_ticks
+        delta_time = now - self._last_time
+        cpu = delta_ticks * 100 / (self._clk_tck * delta_time) if delta_time > 0 else 0.0
+        self._last_ticks, self._last_time = ticks, now
+        
+        rss_pages = int(self._read(self._statm).split()[1])
+        return cpu, rss_pages * self._page_mb
+    
+    def close(self):
+        self._stat.close()
+        if self._statm is not None:
+            self._statm.close()
+
+
+# Errors meaning the monitored process has exited
+_PROCESS_GONE = (psutil.NoSuchProcess, ProcessLookupError, FileNotFoundError)
 
 
 class ProcessMonitor:
     """Monitors process resource usage."""
     
-    def __init__(self, pid: int, interval: float = 0.5):
-        self.pid = pid
-        self.interval = interval
+    # Sample often while the process is young, then back off so long runs
+    # collect roughly TARGET_SAMPLES samples per interval-sized stretch
+    MIN_INTERVAL = 0.05
+    MAX_INTERVAL = 2.0
+    TARGET_SAMPLES = 200
+    
+    __slots__ = ("pid", "max_interval", "metrics", "_stop_event", "_thread")
+    
+    def __init__(self, process: Union[int, subprocess.Popen], max_interval: float = MAX_INTERVAL):
+        self.pid = process if isinstance(process, int) else process.pid
+        self.max_interval = max_interval
         self.metrics = ExecutionMetrics()
         self._stop_event = threading.Event()
         self._thread = None
@@ -153,31 +395,45 @@ class ProcessMonitor:
         self._thread = threading.Thread(target=self._monitor, daemon=True)
         self._thread.start()
     
+    def _open_sampler(self):
+        """Use the direct /proc reader on Linux, psutil elsewhere."""
+        if sys.platform.startswith('linux'):
+            try:
+                return _LinuxFastSampler(self.pid)
+            except _PROCESS_GONE:
+                raise
+            except (OSError, ValueError, IndexError):
+                pass  # /proc unavailable or unexpected format
+        return _PsutilSampler(self.pid)
+    
     def _monitor(self):
         """Monitor process metrics."""
         try:
-            process = psutil.Process(self.pid)
+            sampler = self._open_sampler()
+        except _PROCESS_GONE:
+            logger.warning("Process %s not found", self.pid)
+            return
+        
+        try:
+            t0 = time.monotonic()
+            interval = self.MIN_INTERVAL
             
-            while not self._stop_event.is_set():
+            while not self._stop_event.wait(interval):
                 try:
-                    # CPU usage
-                    cpu = process.cpu_percent(interval=0.1)
-                    self.metrics.cpu_percent.append(cpu)
-                    
-                    # Memory usage
-                    mem = process.memory_info().rss / (1024 * 1024)  # MB
-                    self.metrics.memory_mb.append(mem)
-                    
-                    time.sleep(self.interval)
-                
-                except psutil.NoSuchProcess:
+                    cpu, mem = sampler.sample()
+                except _PROCESS_GONE:
                     break
                 except Exception as e:
-                    logger.error(f"Error monitoring process: {e}")
+                    logger.error("Error monitoring process: %s", e)
                     break
+                
+                self.metrics.add_sample(cpu, mem)
+                
+                elapsed = time.monotonic() - t0
+                interval = min(max(elapsed / self.TARGET_SAMPLES, self.MIN_INTERVAL), self.max_interval)
         
-        except psutil.NoSuchProcess:
-            logger.warning(f"Process {self.pid} not found")
+        finally:
+            sampler.close()
     
     def stop(self):
         """Stop monitoring."""
@@ -187,9 +443,19 @@ class ProcessMonitor:
         self.metrics.finalize()
 
 
+@lru_cache(maxsize=16)
+def _resolve_executable(name: str, search_path: Optional[str]) -> str:
+    """Resolve an interpreter name to an absolute path, once per name and PATH."""
+    return shutil.which(name, path=search_path) or name
+
+
 class ScriptExecutor:
     """Executes Python scripts with monitoring and output streaming."""
     
+    # Upper bound on waiting for output after exit; a grandchild that
+    # inherited the pipes can keep them open past the script's own exit
+    OUTPUT_DRAIN_TIMEOUT = 2.0
+    
     def __init__(
         self,
         script_path: str,
@@ -221,45 +487,53 @@ class ScriptExecutor:
         Returns:
             ExecutionResult with complete execution information
         """
-        logger.info(f"Executing script: {self.script_path}")
+        logger.info("Executing script: %s", self.script_path)
         
-        # Build command
-        cmd = [self.python_executable, self.script_path] + self.args
+        # Inherit the parent environment as-is (env=None) unless there are
+        # overrides, and only then build a merged copy
+        env = {**os.environ, **self.env} if self.env else None
         
-        # Prepare environment
-        import os
-        env = os.environ.copy()
-        if self.env:
-            env.update(self.env)
+        # Build command; an absolute interpreter path skips the PATH search
+        # on every exec. Resolve against the PATH the child will see, so an
+        # override in self.env or a later change to os.environ is honoured.
+        search_path = (env if env is not None else os.environ).get('PATH')
+        cmd = (_resolve_executable(self.python_executable, search_path), self.script_path, *self.args)
         
         try:
             # Start process
             self.status = ExecutionStatus.RUNNING
+            # Default close_fds=True and no start_new_session on purpose.
+            # CPython 3.11 only uses posix_spawn when close_fds=False,
+            # start_new_session=False and cwd is None; otherwise, with no
+            # preexec_fn, _posixsubprocess spawns via vfork on Linux, so the
+            # parent's page tables are not copied either way. A new session
+            # would also detach scripts from the terminal's Ctrl+C.
             self.process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
+                bufsize=OutputStreamHandler.READ_CHUNK,  # Raw bytes; decoded per chunk
                 env=env,
                 cwd=self.working_dir
             )
             
             # Start output handler
-            self.output_handler = OutputStreamHandler(self.process)
+            # Output reaches callers through callbacks and get_full_output,
+            # so nothing polls the batch queue
+            self.output_handler = OutputStreamHandler(self.process, queue_output=False)
             if output_callback:
                 self.output_handler.add_callback(output_callback)
             
             # Start process monitor
-            self.monitor = ProcessMonitor(self.process.pid)
+            self.monitor = ProcessMonitor(self.process)
             self.monitor.start()
             
             # Wait for completion
             try:
                 exit_code = self.process.wait(timeout=self.timeout)
                 
-                # Give output threads time to finish
-                time.sleep(0.5)
+                # Readers exit once the pipes hit EOF after the process ends
+                self.output_handler.join(timeout=self.OUTPUT_DRAIN_TIMEOUT)
                 
                 if exit_code == 0:
                     self.status = ExecutionStatus.COMPLETED
@@ -267,7 +541,7 @@ class ScriptExecutor:
                     self.status = ExecutionStatus.FAILED
                 
             except subprocess.TimeoutExpired:
-                logger.warning(f"Script execution timeout: {self.script_path}")
+                logger.warning("Script execution timeout: %s", self.script_path)
                 self.process.kill()
                 self.process.wait()
                 self.status = ExecutionStatus.TIMEOUT
@@ -280,8 +554,9 @@ class ScriptExecutor:
             if self.output_handler:
                 self.output_handler.stop()
             
-            # Collect output
+            # Collect output, then release the spill files behind it
             stdout, stderr = self.output_handler.get_full_output()
+            self.output_handler.close()
             
             # Create result
             result = ExecutionResult(
@@ -293,16 +568,17 @@ class ScriptExecutor:
             )
             
             logger.info(
-                f"Script execution completed: {self.script_path} "
-                f"(status={self.status.value}, exit_code={exit_code}, "
-                f"duration={result.metrics.duration:.2f}s)"
+                "Script execution completed: %s (status=%s, exit_code=%s, duration=%.2fs)",
+                self.script_path, self.status.value, exit_code, result.metrics.duration
             )
             
             return result
         
         except Exception as e:
-            logger.error(f"Script execution error: {e}")
+            logger.error("Script execution error: %s", e)
             self.status = ExecutionStatus.FAILED
+            if self.output_handler:
+                self.output_handler.close()
             
             return ExecutionResult(
                 status=ExecutionStatus.FAILED,
@@ -316,7 +592,7 @@ class ScriptExecutor:
     def cancel(self):
         """Cancel running execution."""
         if self.process and self.process.poll() is None:
-            logger.info(f"Cancelling script execution: {self.script_path}")
+            logger.info("Cancelling script execution: %s", self.script_path)
             self.process.terminate()
             try:
                 self.process.wait(timeout=5)
@@ -5,6 +5,7 @@ Main launcher engine that orchestrates script execution, monitoring, and managem
 from typing import Optional, Dict, Any, Callable, List
 from pathlib import Path
 import threading
+from dataclasses import dataclass, asdict
 from datetime import datetime
 
 from .script_registry import ScriptMetadata, get_registry
@@ -15,6 +16,21 @@ from .logger import get_logger, get_script_logger
 logger = get_logger(__name__)
 
 
+@dataclass(slots=True)
+class ExecutionRecord:
+    """Single entry in the execution history."""
+    script_id: str
+    script_name: str
+    parameters: Dict[str, Any]
+    status: str
+    exit_code: Optional[int]
+    duration: Optional[float]
+    timestamp: str
+    
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
 class LauncherEngine:
     """
     Main engine for launching and managing Python scripts.
@@ -39,7 +55,7 @@ class LauncherEngine:
         self.registry = get_registry()
         self.parameter_manager = ParameterManager()
         self.active_executions: Dict[str, ScriptExecutor] = {}
-        self.execution_history: List[Dict[str, Any]] = []
+        self.execution_history: List[ExecutionRecord] = []
         
         logger.info("Launcher engine initialized")
     
@@ -199,6 +215,10 @@ class LauncherEngine:
         """Get list of active execution IDs."""
         return list(self.active_executions.keys())
     
+    def active_count(self) -> int:
+        """Get the number of active executions."""
+        return len(self.active_executions)
+    
     def _record_execution(
         self,
         script_id: str,
@@ -207,15 +227,15 @@ class LauncherEngine:
         result: ExecutionResult
     ):
         """Record execution in history."""
-        record = {
-            'script_id': script_id,
-            'script_name': script_name,
-            'parameters': parameters,
-            'status': result.status.value,
-            'exit_code': result.exit_code,
-            'duration': result.metrics.duration if result.metrics else None,
-            'timestamp': datetime.now().isoformat()
-        }
+        record = ExecutionRecord(
+            script_id=script_id,
+            script_name=script_name,
+            parameters=parameters,
+            status=result.status.value,
+            exit_code=result.exit_code,
+            duration=result.metrics.duration if result.metrics else None,
+            timestamp=datetime.now().isoformat()
+        )
         
         self.execution_history.append(record)
         
@@ -225,6 +245,10 @@ class LauncherEngine:
     
     def get_execution_history(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get recent execution history."""
+        return [record.to_dict() for record in self.execution_history[-limit:]]
+    
+    def get_execution_records(self, limit: int = 100) -> List[ExecutionRecord]:
+        """Get recent execution history as records, without dict conversion."""
         return self.execution_history[-limit:]
     
     def quick_launch(
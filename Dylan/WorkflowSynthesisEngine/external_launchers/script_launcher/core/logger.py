@@ -2,16 +2,39 @@
 Production-grade logging system with rotation, formatting, and multi-output support.
 """
 
+import atexit
 import logging
+import os
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 import threading
 
 
-class ColoredFormatter(logging.Formatter):
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the formatted timestamp within the same second."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._time_cache = (None, '')  # (whole second, formatted time)
+    
+    def formatTime(self, record, datefmt=None):
+        datefmt = datefmt or self.datefmt
+        if datefmt is None:
+            # The default format includes milliseconds, so it can't be reused
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, formatted = self._time_cache
+        if second != cached_second:
+            formatted = super().formatTime(record, datefmt)
+            self._time_cache = (second, formatted)
+        return formatted
+
+
+class ColoredFormatter(CachedTimeFormatter):
     """Custom formatter with color support for terminal output."""
     
     COLORS = {
@@ -23,12 +46,39 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = '\033[0m'
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The terminal doesn't change under us, so decide on color once
+        self._use_color = bool(getattr(sys.stderr, 'isatty', lambda: False)())
+        self._colored = {lvl: f"{color}{lvl}{self.RESET}" for lvl, color in self.COLORS.items()}
+    
     def format(self, record):
-        if hasattr(sys.stderr, 'isatty') and sys.stderr.isatty():
-            levelname = record.levelname
-            if levelname in self.COLORS:
-                record.levelname = f"{self.COLORS[levelname]}{levelname}{self.RESET}"
-        return super().format(record)
+        if not self._use_color:
+            return super().format(record)
+        levelname = record.levelname
+        record.levelname = self._colored.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            # Don't leak color codes into other handlers' output
+            record.levelname = levelname
+
+
+class _FileRouter(logging.Handler):
+    """Hands each record to the file handler of the logger that emitted it."""
+    
+    def __init__(self):
+        super().__init__()
+        self.handlers: Dict[str, logging.Handler] = {}
+    
+    def handle(self, record):
+        handler = self.handlers.get(record.name)
+        if handler is not None and record.levelno >= handler.level:
+            handler.handle(record)
+        return True
+    
+    def emit(self, record):
+        self.handle(record)
 
 
 class ScriptLauncherLogger:
@@ -51,6 +101,26 @@ class ScriptLauncherLogger:
         self.loggers = {}
         self.log_dir = Path.home() / 'script_launcher' / 'logs'
         self.log_dir.mkdir(parents=True, exist_ok=True)
+        
+        # One console handler serves every logger
+        self.console_handler = logging.StreamHandler(sys.stdout)
+        self.console_handler.setLevel(logging.INFO)
+        self.console_handler.setFormatter(ColoredFormatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        ))
+        
+        # Loggers only enqueue records; a listener thread does the console
+        # and file I/O so callers never block on writes or rollovers
+        self.file_router = _FileRouter()
+        self._queue = queue.SimpleQueue()
+        self.queue_handler = QueueHandler(self._queue)
+        self._listener = QueueListener(
+            self._queue, self.console_handler, self.file_router,
+            respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self._listener.stop)
     
     def get_logger(self, name: str, log_file: Optional[str] = None) -> logging.Logger:
         """
@@ -70,15 +140,8 @@ class ScriptLauncherLogger:
         logger.setLevel(logging.DEBUG)
         logger.propagate = False
         
-        # Console handler with colors
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        console_formatter = ColoredFormatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        # Records go through the shared queue to the listener thread
+        logger.addHandler(self.queue_handler)
         
         # File handler with rotation
         if log_file is None:
@@ -92,12 +155,12 @@ class ScriptLauncherLogger:
             encoding='utf-8'
         )
         file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter(
+        file_formatter = CachedTimeFormatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        self.file_router.handlers[name] = file_handler
         
         self.loggers[name] = logger
         return logger
@@ -122,12 +185,15 @@ class ScriptLauncherLogger:
         current_time = time.time()
         cutoff_time = current_time - (days * 86400)
         
-        for log_file in self.log_dir.glob('*.log*'):
-            if log_file.stat().st_mtime < cutoff_time:
+        with os.scandir(self.log_dir) as entries:
+            for entry in entries:
+                if '.log' not in entry.name:
+                    continue
                 try:
-                    log_file.unlink()
-                except Exception as e:
-                    print(f"Failed to delete old log {log_file}: {e}")
+                    if entry.stat(follow_symlinks=False).st_mtime < cutoff_time:
+                        os.unlink(entry.path)
+                except OSError as e:
+                    print(f"Failed to delete old log {entry.path}: {e}")
 
 
 # Global logger instance
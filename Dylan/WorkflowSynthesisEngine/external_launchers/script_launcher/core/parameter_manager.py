@@ -2,26 +2,114 @@
 Parameter manager for validating, converting, and managing script parameters.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from pathlib import Path
 import json
+import os
+import orjson
 
 from .script_registry import ScriptParameter
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Preset storage; the directory is created on the first save
+_PRESET_DIR = Path.home() / 'script_launcher' / 'config' / 'presets'
+_preset_dir_ready = False
+
 
 class ParameterValidationError(Exception):
     """Raised when parameter validation fails."""
     pass
 
 
+def _check_range(param: ScriptParameter, converted):
+    """Enforce a numeric parameter's min/max bounds."""
+    if param.min_value is not None and converted < param.min_value:
+        raise ParameterValidationError(
+            f"Parameter '{param.name}' must be >= {param.min_value}"
+        )
+    if param.max_value is not None and converted > param.max_value:
+        raise ParameterValidationError(
+            f"Parameter '{param.name}' must be <= {param.max_value}"
+        )
+    return converted
+
+
+def _convert_string(param: ScriptParameter, value: Any) -> str:
+    return str(value)
+
+
+def _convert_int(param: ScriptParameter, value: Any) -> int:
+    return _check_range(param, int(value))
+
+
+def _convert_float(param: ScriptParameter, value: Any) -> float:
+    return _check_range(param, float(value))
+
+
+def _convert_bool(param: ScriptParameter, value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.lower() in ('true', 'yes', '1', 'on')
+    return bool(value)
+
+
+def _convert_file(param: ScriptParameter, value: Any) -> str:
+    path = Path(value)
+    if not path.exists():
+        raise ParameterValidationError(
+            f"File not found: {value}"
+        )
+    if not path.is_file():
+        raise ParameterValidationError(
+            f"Path is not a file: {value}"
+        )
+    return str(path.absolute())
+
+
+def _convert_directory(param: ScriptParameter, value: Any) -> str:
+    path = Path(value)
+    if not path.exists():
+        raise ParameterValidationError(
+            f"Directory not found: {value}"
+        )
+    if not path.is_dir():
+        raise ParameterValidationError(
+            f"Path is not a directory: {value}"
+        )
+    return str(path.absolute())
+
+
+def _convert_choice(param: ScriptParameter, value: Any) -> Any:
+    if param.choices is None or len(param.choices) == 0:
+        raise ParameterValidationError(
+            f"No choices defined for parameter '{param.name}'"
+        )
+    if value not in param.choices:
+        raise ParameterValidationError(
+            f"Parameter '{param.name}' must be one of: {param.choices}"
+        )
+    return value
+
+
 class ParameterManager:
     """Manages parameter validation, conversion, and command-line generation."""
     
-    @staticmethod
-    def validate_parameter(param: ScriptParameter, value: Any) -> Any:
+    # Parameter type -> converter(param, value); each raises on invalid input
+    _HANDLERS: Dict[str, Callable[[ScriptParameter, Any], Any]] = {
+        'string': _convert_string,
+        'int': _convert_int,
+        'float': _convert_float,
+        'bool': _convert_bool,
+        'file': _convert_file,
+        'directory': _convert_directory,
+        'choice': _convert_choice,
+    }
+    
+    @classmethod
+    def validate_parameter(cls, param: ScriptParameter, value: Any) -> Any:
         """
         Validate and convert a parameter value according to its specification.
         
@@ -35,6 +123,11 @@ class ParameterManager:
         Raises:
             ParameterValidationError: If validation fails
         """
+        return cls._validate(param, value, cls._HANDLERS.get(param.type))
+    
+    @staticmethod
+    def _validate(param: ScriptParameter, value: Any, handler) -> Any:
+        """Validate a value with an already-resolved type handler."""
         # Check required
         if param.required and (value is None or value == ""):
             raise ParameterValidationError(
@@ -45,90 +138,22 @@ class ParameterManager:
         if value is None or value == "":
             return param.default
         
+        if handler is None:
+            raise ParameterValidationError(
+                f"Unknown parameter type: {param.type}"
+            )
+        
         # Type conversion and validation
         try:
-            if param.type == 'string':
-                converted = str(value)
-            
-            elif param.type == 'int':
-                converted = int(value)
-                if param.min_value is not None and converted < param.min_value:
-                    raise ParameterValidationError(
-                        f"Parameter '{param.name}' must be >= {param.min_value}"
-                    )
-                if param.max_value is not None and converted > param.max_value:
-                    raise ParameterValidationError(
-                        f"Parameter '{param.name}' must be <= {param.max_value}"
-                    )
-            
-            elif param.type == 'float':
-                converted = float(value)
-                if param.min_value is not None and converted < param.min_value:
-                    raise ParameterValidationError(
-                        f"Parameter '{param.name}' must be >= {param.min_value}"
-                    )
-                if param.max_value is not None and converted > param.max_value:
-                    raise ParameterValidationError(
-                        f"Parameter '{param.name}' must be <= {param.max_value}"
-                    )
-            
-            elif param.type == 'bool':
-                if isinstance(value, bool):
-                    converted = value
-                elif isinstance(value, str):
-                    converted = value.lower() in ('true', 'yes', '1', 'on')
-                else:
-                    converted = bool(value)
-            
-            elif param.type == 'file':
-                path = Path(value)
-                if not path.exists():
-                    raise ParameterValidationError(
-                        f"File not found: {value}"
-                    )
-                if not path.is_file():
-                    raise ParameterValidationError(
-                        f"Path is not a file: {value}"
-                    )
-                converted = str(path.absolute())
-            
-            elif param.type == 'directory':
-                path = Path(value)
-                if not path.exists():
-                    raise ParameterValidationError(
-                        f"Directory not found: {value}"
-                    )
-                if not path.is_dir():
-                    raise ParameterValidationError(
-                        f"Path is not a directory: {value}"
-                    )
-                converted = str(path.absolute())
-            
-            elif param.type == 'choice':
-                if param.choices is None or len(param.choices) == 0:
-                    raise ParameterValidationError(
-                        f"No choices defined for parameter '{param.name}'"
-                    )
-                if value not in param.choices:
-                    raise ParameterValidationError(
-                        f"Parameter '{param.name}' must be one of: {param.choices}"
-                    )
-                converted = value
-            
-            else:
-                raise ParameterValidationError(
-                    f"Unknown parameter type: {param.type}"
-                )
-            
-            return converted
-            
+            return handler(param, value)
         except (ValueError, TypeError) as e:
             raise ParameterValidationError(
                 f"Failed to convert parameter '{param.name}' to {param.type}: {e}"
             )
     
-    @staticmethod
+    @classmethod
     def validate_parameters(
+        cls,
         parameters: List[ScriptParameter],
         values: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -145,13 +170,10 @@ class ParameterManager:
         Raises:
             ParameterValidationError: If any validation fails
         """
-        validated = {}
-        
-        for param in parameters:
-            value = values.get(param.name)
-            validated[param.name] = ParameterManager.validate_parameter(param, value)
-        
-        return validated
+        validate = cls._validate
+        get = values.get
+        handlers = cls._HANDLERS.get
+        return {p.name: validate(p, get(p.name), handlers(p.type)) for p in parameters}
     
     @staticmethod
     def build_command_args(
@@ -231,18 +253,20 @@ class ParameterManager:
         Returns:
             True if saved successfully
         """
-        preset_dir = Path.home() / 'script_launcher' / 'config' / 'presets'
-        preset_dir.mkdir(parents=True, exist_ok=True)
+        global _preset_dir_ready
+        if not _preset_dir_ready:
+            _PRESET_DIR.mkdir(parents=True, exist_ok=True)
+            _preset_dir_ready = True
         
-        preset_file = preset_dir / f"{script_id}_{preset_name}.json"
+        preset_file = _PRESET_DIR / f"{script_id}_{preset_name}.json"
         
         try:
-            with open(preset_file, 'w', encoding='utf-8') as f:
-                json.dump(values, f, indent=2, ensure_ascii=False)
-            logger.info(f"Saved parameter preset: {preset_name}")
+            # orjson always emits UTF-8, matching ensure_ascii=False
+            preset_file.write_bytes(orjson.dumps(values, option=orjson.OPT_INDENT_2))
+            logger.info("Saved parameter preset: %s", preset_name)
             return True
         except Exception as e:
-            logger.error(f"Failed to save parameter preset: {e}")
+            logger.error("Failed to save parameter preset: %s", e)
             return False
     
     @staticmethod
@@ -257,18 +281,17 @@ class ParameterManager:
         Returns:
             Parameter values or None if not found
         """
-        preset_file = Path.home() / 'script_launcher' / 'config' / 'presets' / f"{script_id}_{preset_name}.json"
+        preset_file = _PRESET_DIR / f"{script_id}_{preset_name}.json"
         
         if not preset_file.exists():
             return None
         
         try:
-            with open(preset_file, 'r', encoding='utf-8') as f:
-                values = json.load(f)
-            logger.info(f"Loaded parameter preset: {preset_name}")
+            values = orjson.loads(preset_file.read_bytes())
+            logger.info("Loaded parameter preset: %s", preset_name)
             return values
         except Exception as e:
-            logger.error(f"Failed to load parameter preset: {e}")
+            logger.error("Failed to load parameter preset: %s", e)
             return None
     
     @staticmethod
@@ -282,16 +305,17 @@ class ParameterManager:
         Returns:
             List of preset names
         """
-        preset_dir = Path.home() / 'script_launcher' / 'config' / 'presets'
-        if not preset_dir.exists():
-            return []
-        
-        presets = []
         prefix = f"{script_id}_"
         
-        for preset_file in preset_dir.glob(f"{prefix}*.json"):
-            preset_name = preset_file.stem[len(prefix):]
-            presets.append(preset_name)
-        
-        return sorted(presets)
+        try:
+            with os.scandir(_PRESET_DIR) as entries:
+                return sorted(
+                    entry.name[len(prefix):-len('.json')]
+                    for entry in entries
+                    if entry.name.startswith(prefix)
+                    and entry.name.endswith('.json')
+                    and entry.is_file(follow_symlinks=False)
+                )
+        except FileNotFoundError:
+            return []
 
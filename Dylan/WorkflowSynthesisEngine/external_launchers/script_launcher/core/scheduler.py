@@ -3,15 +3,26 @@ Scheduler for automated script execution using APScheduler.
 """
 
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.date import DateTrigger
 from typing import Dict, Any, Optional, List
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
+import atexit
 import threading
-import json
+import msgpack
+import orjson
+import os
+import time
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows: in-process locking only
+    fcntl = None
+
 from .launcher_engine import get_engine
 from .script_registry import get_registry
 from .logger import get_logger
@@ -19,6 +30,44 @@ from .logger import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _cron_trigger(minute: str, hour: str, day: str, month: str, day_of_week: str) -> CronTrigger:
+    """Build a CronTrigger, reusing the parsed trigger for repeated expressions."""
+    return CronTrigger(
+        minute=minute,
+        hour=hour,
+        day=day,
+        month=month,
+        day_of_week=day_of_week
+    )
+
+
+def _utc_timestamp() -> str:
+    """Current time as a UTC ISO string to the second, the created_at format."""
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+
+def _normalize_created_at(value: str) -> str:
+    """Convert a stored created_at to the UTC format; legacy naive values are local time."""
+    try:
+        stamp = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return value
+    return stamp.astimezone(timezone.utc).isoformat(timespec='seconds')
+
+
+def _build_trigger(trigger_type: str, trigger_args: Dict[str, Any]):
+    """Build a trigger from its persisted (type, args) form, raising ValueError if invalid."""
+    builders = {'cron': _cron_trigger, 'interval': IntervalTrigger, 'date': DateTrigger}
+    builder = builders.get(trigger_type)
+    if builder is None:
+        raise ValueError(f"Unknown trigger type: {trigger_type}")
+    try:
+        return builder(**trigger_args)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid {trigger_type} trigger {trigger_args}: {e}") from e
+
+
 class ScriptScheduler:
     """
     Scheduler for automated script execution.
@@ -28,71 +77,124 @@ class ScriptScheduler:
     _instance = None
     _lock = threading.Lock()
     
+    # Window for coalescing bursts of schedule changes into one disk write
+    FLUSH_COALESCE_MS = 200
+    
+    # Scheduled runs mostly wait on child processes, so a thread pool is enough
+    MAX_CONCURRENT_JOBS = 32
+    JOB_DEFAULTS = {
+        'coalesce': True,           # Collapse missed firings into one run
+        'max_instances': 1,         # Never overlap runs of the same job
+        'misfire_grace_time': 60,   # Seconds a late run may still start
+    }
+    
     def __new__(cls):
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:
-                    cls._instance = super().__new__(cls)
+                    instance = super().__new__(cls)
+                    instance._init()
+                    cls._instance = instance
         return cls._instance
     
-    def __init__(self):
-        if hasattr(self, '_initialized'):
-            return
-        self._initialized = True
-        
+    def _init(self):
+        """One-time initialization, run under the class lock."""
         self.engine = get_engine()
         self.registry = get_registry()
-        self.scheduler = BackgroundScheduler()
+        self.scheduler = BackgroundScheduler(
+            executors={'default': ThreadPoolExecutor(self.MAX_CONCURRENT_JOBS)},
+            job_defaults=self.JOB_DEFAULTS
+        )
         self.scheduled_jobs: Dict[str, Dict[str, Any]] = {}
         
         self.config_dir = Path.home() / 'script_launcher' / 'config'
-        self.schedule_file = self.config_dir / 'schedules.json'
+        self.schedule_file = self.config_dir / 'schedules.msgpack'
+        self.legacy_schedule_file = self.config_dir / 'schedules.json'
+        self.schedule_lock_file = self.config_dir / 'schedules.lock'
         
+        self._dirty = threading.Event()
+        self._save_lock = threading.Lock()
+        self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flush_thread.start()
+        # The flusher is a daemon thread, so write out pending changes at exit
+        atexit.register(self._flush_if_dirty)
+        
+        # Restore before start(): jobs added to a stopped scheduler are only
+        # queued, then committed together with a single wakeup when it starts
         self._load_schedules()
         self.scheduler.start()
         
         logger.info("Scheduler initialized")
     
     def _load_schedules(self):
-        """Load saved schedules from disk."""
+        """
+        Load saved schedules from disk, falling back to the legacy JSON file.
+        
+        Must run before the scheduler starts so restored jobs are batched.
+        """
         if self.schedule_file.exists():
-            try:
-                with open(self.schedule_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    
-                for job_id, job_data in data.items():
-                    try:
-                        self._restore_job(job_id, job_data)
-                    except Exception as e:
-                        logger.error(f"Failed to restore job {job_id}: {e}")
-                
-                logger.info(f"Loaded {len(self.scheduled_jobs)} scheduled jobs")
-            except Exception as e:
-                logger.error(f"Failed to load schedules: {e}")
+            loads, schedule_file = msgpack.unpackb, self.schedule_file
+        elif self.legacy_schedule_file.exists():
+            loads, schedule_file = orjson.loads, self.legacy_schedule_file
+        else:
+            return
+        
+        try:
+            data = loads(schedule_file.read_bytes())
+            
+            for job_id, job_data in data.items():
+                try:
+                    self._restore_job(job_id, job_data)
+                except Exception as e:
+                    logger.error(f"Failed to restore job {job_id}: {e}")
+            
+            logger.info(f"Loaded {len(self.scheduled_jobs)} scheduled jobs")
+        except Exception as e:
+            logger.error(f"Failed to load schedules: {e}")
     
     def _save_schedules(self):
-        """Save schedules to disk."""
+        """Mark schedules dirty; the flusher thread writes them shortly after."""
+        self._dirty.set()
+    
+    def _flush_loop(self):
+        """Coalesce schedule changes and write them in the background."""
+        while True:
+            self._dirty.wait()
+            time.sleep(self.FLUSH_COALESCE_MS / 1000)
+            self._flush_if_dirty()
+    
+    def _flush_if_dirty(self):
+        """Write schedules if changes are pending, after any write in progress."""
+        with self._save_lock:
+            if self._dirty.is_set():
+                self._dirty.clear()
+                self._write_schedules()
+    
+    def _write_schedules(self):
+        """
+        Write schedules to disk atomically. Caller holds ``_save_lock``.
+        
+        An exclusive lock on a sidecar lock file keeps API workers in other
+        processes from interleaving writes to the shared temp file.
+        """
         try:
-            with open(self.schedule_file, 'w', encoding='utf-8') as f:
-                json.dump(self.scheduled_jobs, f, indent=2, ensure_ascii=False)
+            data = msgpack.packb(dict(self.scheduled_jobs), use_bin_type=True)
+            tmp_file = self.schedule_file.with_suffix('.msgpack.tmp')
+            with open(self.schedule_lock_file, 'a') as lock:
+                if fcntl:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+                with open(tmp_file, 'wb') as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.schedule_file)
             logger.debug("Schedules saved")
         except Exception as e:
             logger.error(f"Failed to save schedules: {e}")
     
     def _restore_job(self, job_id: str, job_data: Dict[str, Any]):
         """Restore a job from saved data."""
-        trigger_type = job_data['trigger_type']
-        trigger_args = job_data['trigger_args']
-        
-        if trigger_type == 'cron':
-            trigger = CronTrigger(**trigger_args)
-        elif trigger_type == 'interval':
-            trigger = IntervalTrigger(**trigger_args)
-        elif trigger_type == 'date':
-            trigger = DateTrigger(**trigger_args)
-        else:
-            logger.error(f"Unknown trigger type: {trigger_type}")
-            return
+        trigger = _build_trigger(job_data['trigger_type'], job_data['trigger_args'])
         
         self.scheduler.add_job(
             func=self._execute_scheduled_script,
@@ -102,6 +204,15 @@ class ScriptScheduler:
             name=job_data['name']
         )
         
+        # Entries saved before created_at moved to UTC hold naive local
+        # time; rewrite them so every entry uses one format
+        created_at = job_data.get('created_at')
+        if created_at:
+            normalized = _normalize_created_at(created_at)
+            if normalized != created_at:
+                job_data = {**job_data, 'created_at': normalized}
+                self._save_schedules()
+        
         self.scheduled_jobs[job_id] = job_data
         logger.info(f"Restored scheduled job: {job_data['name']}")
     
@@ -124,59 +235,34 @@ class ScriptScheduler:
             cron_expression: Cron expression (minute hour day month day_of_week)
             
         Returns:
-            True if scheduled successfully
+            True once scheduled
+            
+        Raises:
+            ValueError: If cron_expression is malformed
         """
+        # Validate up-front; trigger construction rejects bad field values
+        parts = cron_expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron expression must have 5 parts: '{cron_expression}'")
+        
+        minute, hour, day, month, day_of_week = parts
         try:
-            # Parse cron expression
-            parts = cron_expression.split()
-            if len(parts) != 5:
-                logger.error("Cron expression must have 5 parts")
-                return False
-            
-            minute, hour, day, month, day_of_week = parts
-            
-            trigger = CronTrigger(
-                minute=minute,
-                hour=hour,
-                day=day,
-                month=month,
-                day_of_week=day_of_week
-            )
-            
-            # Add job
-            self.scheduler.add_job(
-                func=self._execute_scheduled_script,
-                trigger=trigger,
-                id=job_id,
-                args=[script_id, parameters],
-                name=name,
-                replace_existing=True
-            )
-            
-            # Save job data
-            self.scheduled_jobs[job_id] = {
-                'job_id': job_id,
-                'name': name,
-                'script_id': script_id,
-                'parameters': parameters,
-                'trigger_type': 'cron',
-                'trigger_args': {
-                    'minute': minute,
-                    'hour': hour,
-                    'day': day,
-                    'month': month,
-                    'day_of_week': day_of_week
-                },
-                'created_at': datetime.now().isoformat()
+            trigger = _cron_trigger(minute, hour, day, month, day_of_week)
+        except ValueError as e:
+            raise ValueError(f"Invalid cron expression '{cron_expression}': {e}") from e
+        
+        self._add_job(
+            job_id, name, script_id, parameters, trigger, 'cron',
+            {
+                'minute': minute,
+                'hour': hour,
+                'day': day,
+                'month': month,
+                'day_of_week': day_of_week
             }
-            
-            self._save_schedules()
-            logger.info(f"Scheduled job: {name} with cron: {cron_expression}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to schedule job: {e}")
-            return False
+        )
+        logger.info(f"Scheduled job: {name} with cron: {cron_expression}")
+        return True
     
     def schedule_interval(
         self,
@@ -200,53 +286,32 @@ class ScriptScheduler:
             seconds, minutes, hours, days: Interval components
             
         Returns:
-            True if scheduled successfully
+            True once scheduled
+            
+        Raises:
+            ValueError: If no interval component is given or one is invalid
         """
+        trigger_args = {}
+        if seconds:
+            trigger_args['seconds'] = seconds
+        if minutes:
+            trigger_args['minutes'] = minutes
+        if hours:
+            trigger_args['hours'] = hours
+        if days:
+            trigger_args['days'] = days
+        
+        if not trigger_args:
+            raise ValueError("At least one interval component must be specified")
+        
         try:
-            trigger_args = {}
-            if seconds:
-                trigger_args['seconds'] = seconds
-            if minutes:
-                trigger_args['minutes'] = minutes
-            if hours:
-                trigger_args['hours'] = hours
-            if days:
-                trigger_args['days'] = days
-            
-            if not trigger_args:
-                logger.error("At least one interval component must be specified")
-                return False
-            
             trigger = IntervalTrigger(**trigger_args)
-            
-            # Add job
-            self.scheduler.add_job(
-                func=self._execute_scheduled_script,
-                trigger=trigger,
-                id=job_id,
-                args=[script_id, parameters],
-                name=name,
-                replace_existing=True
-            )
-            
-            # Save job data
-            self.scheduled_jobs[job_id] = {
-                'job_id': job_id,
-                'name': name,
-                'script_id': script_id,
-                'parameters': parameters,
-                'trigger_type': 'interval',
-                'trigger_args': trigger_args,
-                'created_at': datetime.now().isoformat()
-            }
-            
-            self._save_schedules()
-            logger.info(f"Scheduled job: {name} with interval: {trigger_args}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to schedule job: {e}")
-            return False
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid interval {trigger_args}: {e}") from e
+        
+        self._add_job(job_id, name, script_id, parameters, trigger, 'interval', trigger_args)
+        logger.info(f"Scheduled job: {name} with interval: {trigger_args}")
+        return True
     
     def schedule_once(
         self,
@@ -267,39 +332,103 @@ class ScriptScheduler:
             run_date: When to run the script
             
         Returns:
-            True if scheduled successfully
+            True once scheduled
+            
+        Raises:
+            ValueError: If run_date is invalid or not in the future
         """
+        now = datetime.now(run_date.tzinfo)
+        if run_date <= now:
+            raise ValueError(
+                f"run_date {run_date.isoformat()} is not in the future "
+                f"(now {now.isoformat()})"
+            )
+        
         try:
             trigger = DateTrigger(run_date=run_date)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid run date {run_date}: {e}") from e
+        
+        self._add_job(
+            job_id, name, script_id, parameters, trigger, 'date',
+            {'run_date': run_date.isoformat()}
+        )
+        logger.info(f"Scheduled job: {name} for {run_date}")
+        return True
+    
+    def schedule_batch(self, jobs: List[Dict[str, Any]]) -> List[str]:
+        """
+        Schedule several jobs at once, stamped with one shared created_at.
+        
+        Args:
+            jobs: Job specs with job_id, name, script_id, parameters,
+                trigger_type ('cron', 'interval' or 'date') and trigger_args
+                in the form they are saved in
             
-            # Add job
-            self.scheduler.add_job(
-                func=self._execute_scheduled_script,
-                trigger=trigger,
-                id=job_id,
-                args=[script_id, parameters],
-                name=name,
-                replace_existing=True
-            )
-            
-            # Save job data
-            self.scheduled_jobs[job_id] = {
-                'job_id': job_id,
-                'name': name,
-                'script_id': script_id,
-                'parameters': parameters,
-                'trigger_type': 'date',
-                'trigger_args': {'run_date': run_date.isoformat()},
-                'created_at': datetime.now().isoformat()
-            }
-            
-            self._save_schedules()
-            logger.info(f"Scheduled job: {name} for {run_date}")
-            return True
+        Returns:
+            IDs of the scheduled jobs
             
-        except Exception as e:
-            logger.error(f"Failed to schedule job: {e}")
-            return False
+        Raises:
+            ValueError: If any job is invalid; no job is scheduled then
+        """
+        # Validate every job before adding any
+        triggers = []
+        for job in jobs:
+            trigger = _build_trigger(job['trigger_type'], job['trigger_args'])
+            if job['trigger_type'] == 'date':
+                now = datetime.now(trigger.run_date.tzinfo)
+                if trigger.run_date <= now:
+                    raise ValueError(
+                        f"run_date for job {job['job_id']} is not in the future"
+                    )
+            triggers.append(trigger)
+        
+        created_at = _utc_timestamp()
+        for job, trigger in zip(jobs, triggers):
+            self._add_job(
+                job['job_id'], job['name'], job['script_id'], job.get('parameters') or {},
+                trigger, job['trigger_type'], job['trigger_args'], created_at
+            )
+        
+        logger.info(f"Scheduled batch of {len(jobs)} jobs")
+        return [job['job_id'] for job in jobs]
+    
+    def _add_job(
+        self,
+        job_id: str,
+        name: str,
+        script_id: str,
+        parameters: Dict[str, Any],
+        trigger,
+        trigger_type: str,
+        trigger_args: Dict[str, Any],
+        created_at: Optional[str] = None
+    ):
+        """
+        Add a job with an already-validated trigger and record it for persistence.
+        
+        Batch callers pass one shared ``created_at`` instead of reading the
+        clock per job.
+        """
+        self.scheduler.add_job(
+            func=self._execute_scheduled_script,
+            trigger=trigger,
+            id=job_id,
+            args=[script_id, parameters],
+            name=name,
+            replace_existing=True
+        )
+        
+        self.scheduled_jobs[job_id] = {
+            'job_id': job_id,
+            'name': name,
+            'script_id': script_id,
+            'parameters': parameters,
+            'trigger_type': trigger_type,
+            'trigger_args': trigger_args,
+            'created_at': created_at or _utc_timestamp()
+        }
+        self._save_schedules()
     
     def unschedule(self, job_id: str) -> bool:
         """
@@ -327,16 +456,14 @@ class ScriptScheduler:
     
     def get_scheduled_jobs(self) -> List[Dict[str, Any]]:
         """Get list of all scheduled jobs."""
+        # Index live jobs once instead of a get_job() lookup per entry
+        jobs_by_id = {job.id: job for job in self.scheduler.get_jobs()}
         jobs = []
         
         for job_id, job_data in self.scheduled_jobs.items():
-            # Get next run time from scheduler
-            job = self.scheduler.get_job(job_id)
+            job = jobs_by_id.get(job_id)
             next_run = job.next_run_time.isoformat() if job and job.next_run_time else None
-            
-            job_info = job_data.copy()
-            job_info['next_run'] = next_run
-            jobs.append(job_info)
+            jobs.append({**job_data, 'next_run': next_run})
         
         return jobs
     
@@ -368,13 +495,26 @@ class ScriptScheduler:
         """Shutdown the scheduler."""
         logger.info("Shutting down scheduler")
         self.scheduler.shutdown()
+        
+        # Write out any change still waiting for the flusher
+        self._flush_if_dirty()
 
 
-# Global scheduler instance
-_scheduler = ScriptScheduler()
+# Global scheduler instance, created on first use so importing this
+# module does not start the background scheduler or touch the disk
+_scheduler: Optional[ScriptScheduler] = None
+_scheduler_lock = threading.Lock()
 
 
 def get_scheduler() -> ScriptScheduler:
     """Get the global scheduler instance."""
-    return _scheduler
+    global _scheduler
+    scheduler = _scheduler
+    if scheduler is None:
+        with _scheduler_lock:
+            scheduler = _scheduler
+            if scheduler is None:
+                scheduler = ScriptScheduler()
+                _scheduler = scheduler
+    return scheduler
 
@@ -2,20 +2,23 @@
 Script registry for managing Python scripts, their metadata, and configurations.
 """
 
+import atexit
 import json
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict, field
+from typing import Dict, Iterator, List, Optional, Any, Set, Tuple
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime
 import hashlib
 import threading
+import orjson
 
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScriptParameter:
     """Represents a script parameter configuration."""
     name: str
@@ -28,14 +31,24 @@ class ScriptParameter:
     max_value: Optional[float] = None
     
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Spelled out rather than asdict(), which introspects and deep-copies every field
+        return {
+            'name': self.name,
+            'type': self.type,
+            'description': self.description,
+            'default': self.default,
+            'required': self.required,
+            'choices': list(self.choices) if self.choices is not None else None,
+            'min_value': self.min_value,
+            'max_value': self.max_value,
+        }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'ScriptParameter':
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScriptMetadata:
     """Complete metadata for a registered script."""
     id: str
@@ -60,9 +73,29 @@ class ScriptMetadata:
     enabled: bool = True
     
     def to_dict(self) -> dict:
-        data = asdict(self)
-        data['parameters'] = [p.to_dict() for p in self.parameters]
-        return data
+        # Same keys and order as asdict(), without its generic recursion
+        return {
+            'id': self.id,
+            'name': self.name,
+            'path': self.path,
+            'description': self.description,
+            'parameters': [p.to_dict() for p in self.parameters],
+            'tags': list(self.tags),
+            'author': self.author,
+            'version': self.version,
+            'python_version': self.python_version,
+            'dependencies': list(self.dependencies),
+            'timeout': self.timeout,
+            'working_directory': self.working_directory,
+            'environment_variables': dict(self.environment_variables),
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'last_run': self.last_run,
+            'run_count': self.run_count,
+            'success_count': self.success_count,
+            'failure_count': self.failure_count,
+            'enabled': self.enabled,
+        }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'ScriptMetadata':
@@ -78,72 +111,119 @@ class ScriptMetadata:
             self.success_count += 1
         else:
             self.failure_count += 1
-        self.last_run = datetime.now().isoformat()
-        self.updated_at = datetime.now().isoformat()
+        now = datetime.now().isoformat()
+        self.last_run = now
+        self.updated_at = now
 
 
 class ScriptRegistry:
     """
     Central registry for managing all registered scripts.
-    Thread-safe singleton implementation.
+    Thread-safe; the shared instance is created at import and returned by get_registry().
     """
     
-    _instance = None
-    _lock = threading.Lock()
-    
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
+    # Delay before pending stats updates are written out
+    FLUSH_DELAY = 0.5
     
     def __init__(self):
-        if hasattr(self, '_initialized'):
-            return
-        self._initialized = True
+        self._mutex = threading.Lock()  # Guards mutations and saves
         
         self.config_dir = Path.home() / 'script_launcher' / 'config'
         self.config_dir.mkdir(parents=True, exist_ok=True)
         self.registry_file = self.config_dir / 'registry.json'
         
         self.scripts: Dict[str, ScriptMetadata] = {}
+        self._by_tag: Dict[str, Set[str]] = defaultdict(set)  # tag -> script IDs
+        self._haystacks: Dict[str, str] = {}  # ID -> lowercased name, description and tags, newline-separated
+        self._version = 0  # Bumped whenever the set of scripts or their enabled state changes
+        self._dict_cache: Dict[str, dict] = {}  # script ID -> serialized metadata
+        
+        # Stats updates mark the registry dirty and are saved together shortly after
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        atexit.register(self._flush_if_dirty)
         self._load_registry()
         
         logger.info(f"Script registry initialized with {len(self.scripts)} scripts")
     
     def _generate_script_id(self, script_path: str) -> str:
         """Generate a unique ID for a script based on its path."""
-        return hashlib.md5(script_path.encode()).hexdigest()[:12]
+        # Kept as MD5 so re-registering a path yields the ID it already has
+        return hashlib.md5(script_path.encode('utf-8'), usedforsecurity=False).hexdigest()[:12]
     
     def _load_registry(self):
         """Load registry from disk."""
-        if self.registry_file.exists():
-            try:
-                with open(self.registry_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.scripts = {
-                        script_id: ScriptMetadata.from_dict(script_data)
-                        for script_id, script_data in data.items()
-                    }
-                logger.info(f"Loaded {len(self.scripts)} scripts from registry")
-            except Exception as e:
-                logger.error(f"Failed to load registry: {e}")
-                self.scripts = {}
+        try:
+            data = orjson.loads(self.registry_file.read_bytes())
+            self.scripts = {
+                script_id: ScriptMetadata.from_dict(script_data)
+                for script_id, script_data in data.items()
+            }
+            logger.info(f"Loaded {len(self.scripts)} scripts from registry")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Failed to load registry: {e}")
+            self.scripts = {}
+        
+        # Build every derived index in one pass over the loaded scripts
+        self._by_tag.clear()
+        self._haystacks.clear()
+        self._dict_cache.clear()
+        for script_id, metadata in self.scripts.items():
+            self._index_tags(script_id, metadata.tags)
+            self._index_search(script_id, metadata)
+            self._dict_cache[script_id] = metadata.to_dict()
+    
+    def _index_tags(self, script_id: str, tags: List[str]):
+        """Add a script to the tag index."""
+        for tag in tags:
+            self._by_tag[tag].add(script_id)
+    
+    def _unindex_tags(self, script_id: str, tags: List[str]):
+        """Remove a script from the tag index, dropping tags left empty."""
+        for tag in tags:
+            ids = self._by_tag.get(tag)
+            if ids is not None:
+                ids.discard(script_id)
+                if not ids:
+                    del self._by_tag[tag]
+    
+    def _index_search(self, script_id: str, metadata: ScriptMetadata):
+        """Cache the lowercased text search_scripts matches against."""
+        # Newlines keep a match from spanning two fields
+        self._haystacks[script_id] = "\n".join(
+            [metadata.name, metadata.description, *metadata.tags]
+        ).lower()
     
     def _save_registry(self):
         """Save registry to disk."""
+        self._dirty = False
         try:
-            with open(self.registry_file, 'w', encoding='utf-8') as f:
-                data = {
-                    script_id: metadata.to_dict()
-                    for script_id, metadata in self.scripts.items()
-                }
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Entries are re-serialized only when their script changes; orjson
+            # emits UTF-8 like ensure_ascii=False and the file gets one write
+            self.registry_file.write_bytes(
+                orjson.dumps(self._dict_cache, option=orjson.OPT_INDENT_2)
+            )
             logger.debug("Registry saved successfully")
         except Exception as e:
             logger.error(f"Failed to save registry: {e}")
     
+    def _mark_dirty(self):
+        """Schedule a save, coalescing changes made before it runs. Call with the mutex held."""
+        self._dirty = True
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.FLUSH_DELAY, self._flush_if_dirty)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def _flush_if_dirty(self):
+        """Save the registry if changes are pending."""
+        with self._mutex:
+            self._flush_timer = None
+            if self._dirty:
+                self._save_registry()
+    
     def register_script(self, metadata: ScriptMetadata) -> str:
         """
         Register a new script or update existing one.
@@ -154,35 +234,52 @@ class ScriptRegistry:
         Returns:
             Script ID
         """
-        with self._lock:
+        with self._mutex:
             script_id = metadata.id or self._generate_script_id(metadata.path)
             metadata.id = script_id
             metadata.updated_at = datetime.now().isoformat()
             
-            if script_id in self.scripts:
+            existing = self.scripts.get(script_id)
+            if existing is not None:
                 logger.info(f"Updating script: {metadata.name} ({script_id})")
+                self._unindex_tags(script_id, existing.tags)
             else:
                 logger.info(f"Registering new script: {metadata.name} ({script_id})")
             
             self.scripts[script_id] = metadata
+            self._index_tags(script_id, metadata.tags)
+            self._index_search(script_id, metadata)
+            self._dict_cache[script_id] = metadata.to_dict()
+            self._version += 1
             self._save_registry()
             return script_id
     
     def unregister_script(self, script_id: str) -> bool:
         """Remove a script from the registry."""
-        with self._lock:
-            if script_id in self.scripts:
-                script_name = self.scripts[script_id].name
-                del self.scripts[script_id]
-                self._save_registry()
-                logger.info(f"Unregistered script: {script_name} ({script_id})")
-                return True
-            return False
+        with self._mutex:
+            script = self.scripts.pop(script_id, None)
+            if script is None:
+                return False
+            self._unindex_tags(script_id, script.tags)
+            self._haystacks.pop(script_id, None)
+            self._dict_cache.pop(script_id, None)
+            self._version += 1
+            self._save_registry()
+            logger.info(f"Unregistered script: {script.name} ({script_id})")
+            return True
     
     def get_script(self, script_id: str) -> Optional[ScriptMetadata]:
         """Get script metadata by ID."""
         return self.scripts.get(script_id)
     
+    def count(self) -> int:
+        """Get the number of registered scripts."""
+        return len(self.scripts)
+    
+    def version(self) -> int:
+        """Get a counter that changes whenever scripts are added, removed, or toggled."""
+        return self._version
+    
     def get_all_scripts(self) -> List[ScriptMetadata]:
         """Get all registered scripts."""
         return list(self.scripts.values())
@@ -191,36 +288,52 @@ class ScriptRegistry:
         """Get all enabled scripts."""
         return [s for s in self.scripts.values() if s.enabled]
     
+    def scripts_snapshot(self) -> Tuple[ScriptMetadata, ...]:
+        """Get all scripts as a tuple taken under the lock, safe to iterate off-thread."""
+        with self._mutex:
+            return tuple(self.scripts.values())
+    
+    def iter_enabled_scripts(self) -> Iterator[ScriptMetadata]:
+        """Iterate over enabled scripts from a snapshot, filtering lazily."""
+        return (s for s in self.scripts_snapshot() if s.enabled)
+    
     def search_scripts(self, query: str) -> List[ScriptMetadata]:
         """Search scripts by name, description, or tags."""
         query_lower = query.lower()
-        results = []
-        for script in self.scripts.values():
-            if (query_lower in script.name.lower() or
-                query_lower in script.description.lower() or
-                any(query_lower in tag.lower() for tag in script.tags)):
-                results.append(script)
-        return results
+        # Under the lock so a concurrent register/unregister can't resize
+        # the index mid-scan or drop a matched ID before its lookup
+        with self._mutex:
+            return [
+                self.scripts[script_id]
+                for script_id, haystack in self._haystacks.items()
+                if query_lower in haystack
+            ]
     
     def get_scripts_by_tag(self, tag: str) -> List[ScriptMetadata]:
         """Get all scripts with a specific tag."""
-        return [s for s in self.scripts.values() if tag in s.tags]
+        with self._mutex:
+            return [self.scripts[script_id] for script_id in self._by_tag.get(tag, ())]
     
     def update_script_stats(self, script_id: str, success: bool):
         """Update script execution statistics."""
-        with self._lock:
-            if script_id in self.scripts:
-                self.scripts[script_id].update_stats(success)
-                self._save_registry()
+        with self._mutex:
+            script = self.scripts.get(script_id)
+            if script is not None:
+                script.update_stats(success)
+                self._dict_cache[script_id] = script.to_dict()
+                self._mark_dirty()
     
     def toggle_script(self, script_id: str) -> bool:
         """Enable or disable a script."""
-        with self._lock:
-            if script_id in self.scripts:
-                self.scripts[script_id].enabled = not self.scripts[script_id].enabled
-                self._save_registry()
-                return self.scripts[script_id].enabled
-            return False
+        with self._mutex:
+            script = self.scripts.get(script_id)
+            if script is None:
+                return False
+            script.enabled = not script.enabled
+            self._dict_cache[script_id] = script.to_dict()
+            self._version += 1
+            self._save_registry()
+            return script.enabled
     
     def export_script_config(self, script_id: str, output_path: str) -> bool:
         """Export script configuration to a JSON file."""
@@ -238,10 +351,11 @@ class ScriptRegistry:
     def import_script_config(self, config_path: str) -> Optional[str]:
         """Import script configuration from a JSON file."""
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                metadata = ScriptMetadata.from_dict(data)
-                return self.register_script(metadata)
+            # A config holds one script and from_dict needs every field, so it is
+            # parsed whole; the file is closed before registering (which saves)
+            data = orjson.loads(Path(config_path).read_bytes())
+            metadata = ScriptMetadata.from_dict(data)
+            return self.register_script(metadata)
         except Exception as e:
             logger.error(f"Failed to import script config: {e}")
             return None
@@ -4,10 +4,6 @@ Main GUI window using CustomTkinter for modern macOS-optimized interface.
 
 import customtkinter as ctk
 from typing import Optional
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).parent.parent))
 
 from core import get_engine, get_registry, get_logger
 from .script_panel import ScriptPanel
@@ -7,15 +7,40 @@ from typing import Optional
 import time
 
 
+# Shared bold font, created on first use (CTkFont needs a Tk root)
+_BOLD = None
+
+
+def _bold() -> ctk.CTkFont:
+    """Return the shared bold font."""
+    global _BOLD
+    if _BOLD is None:
+        _BOLD = ctk.CTkFont(weight="bold")
+    return _BOLD
+
+
 class MonitorPanel(ctk.CTkFrame):
     """Panel for monitoring script execution."""
     
+    # (label text, metric key) for each row of the metrics grid
+    METRIC_ROWS = (
+        ("⏱️ Duration:", "duration"),
+        ("🔢 Exit Code:", "exit_code"),
+        ("💾 Peak Memory:", "memory"),
+        ("⚡ Avg CPU:", "cpu"),
+    )
+    
+    # Run the smooth indeterminate animation this long, then fall back to a slow pulse
+    FAST_ANIMATION_MS = 5000
+    PULSE_INTERVAL_MS = 1000
+    
     def __init__(self, parent):
         super().__init__(parent)
         
         self.start_time: Optional[float] = None
         self.timer_running = False
         self.metric_labels: dict[str, ctk.CTkLabel] = {}
+        self._progress_after_id: Optional[str] = None
 
         self._create_ui()
     
@@ -38,7 +63,7 @@ class MonitorPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             status_frame,
             text="Status:",
-            font=ctk.CTkFont(weight="bold")
+            font=_bold()
         ).grid(row=0, column=0, sticky="w", padx=5, pady=5)
         
         self.status_label = ctk.CTkLabel(
@@ -52,7 +77,7 @@ class MonitorPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             status_frame,
             text="Script:",
-            font=ctk.CTkFont(weight="bold")
+            font=_bold()
         ).grid(row=1, column=0, sticky="w", padx=5, pady=5)
         
         self.script_label = ctk.CTkLabel(
@@ -66,17 +91,7 @@ class MonitorPanel(ctk.CTkFrame):
         metrics_frame = ctk.CTkFrame(self)
         metrics_frame.pack(fill="both", expand=True, padx=10, pady=10)
         
-        # Duration
-        self._create_metric_row(metrics_frame, "⏱️ Duration:", "duration", 0)
-        
-        # Exit code
-        self._create_metric_row(metrics_frame, "🔢 Exit Code:", "exit_code", 1)
-        
-        # Peak memory
-        self._create_metric_row(metrics_frame, "💾 Peak Memory:", "memory", 2)
-        
-        # CPU usage
-        self._create_metric_row(metrics_frame, "⚡ Avg CPU:", "cpu", 3)
+        self._create_metric_rows(metrics_frame)
         
         # Progress bar
         progress_frame = ctk.CTkFrame(self)
@@ -85,32 +100,25 @@ class MonitorPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             progress_frame,
             text="Progress:",
-            font=ctk.CTkFont(weight="bold")
+            font=_bold()
         ).pack(anchor="w", padx=5, pady=(5, 0))
         
         self.progress_bar = ctk.CTkProgressBar(progress_frame)
         self.progress_bar.pack(fill="x", padx=5, pady=5)
         self.progress_bar.set(0)
-        
-        # Initialize metric labels
-        self.metric_labels = {}
     
-    def _create_metric_row(self, parent, label_text: str, metric_name: str, row: int):
-        """Create a metric row."""
-        ctk.CTkLabel(
-            parent,
-            text=label_text,
-            font=ctk.CTkFont(weight="bold")
-        ).grid(row=row, column=0, sticky="w", padx=10, pady=8)
-        
-        value_label = ctk.CTkLabel(
-            parent,
-            text="-",
-            anchor="w"
-        )
-        value_label.grid(row=row, column=1, sticky="w", padx=10, pady=8)
-        
-        self.metric_labels[metric_name] = value_label
+    def _create_metric_rows(self, parent):
+        """Create all metric rows, then lay them out in a single grid pass."""
+        rows = []
+        for label_text, metric_name in self.METRIC_ROWS:
+            name_label = ctk.CTkLabel(parent, text=label_text, font=_bold())
+            value_label = ctk.CTkLabel(parent, text="-", anchor="w")
+            self.metric_labels[metric_name] = value_label
+            rows.append((name_label, value_label))
+        
+        for row, (name_label, value_label) in enumerate(rows):
+            name_label.grid(row=row, column=0, sticky="w", padx=10, pady=8)
+            value_label.grid(row=row, column=1, sticky="w", padx=10, pady=8)
     
     def start_execution(self, script_name: str):
         """Start monitoring an execution."""
@@ -127,6 +135,8 @@ class MonitorPanel(ctk.CTkFrame):
         self.progress_bar.set(0)
         self.progress_bar.configure(mode="indeterminate")
         self.progress_bar.start()
+        self._cancel_progress_callback()
+        self._progress_after_id = self.after(self.FAST_ANIMATION_MS, self._start_slow_pulse)
         
         # Start timer update
         self._update_timer()
@@ -134,6 +144,7 @@ class MonitorPanel(ctk.CTkFrame):
     def stop_execution(self, result):
         """Stop monitoring and display final results."""
         self.timer_running = False
+        self._cancel_progress_callback()
         self.progress_bar.stop()
         self.progress_bar.configure(mode="determinate")
         self.progress_bar.set(1.0)
@@ -156,10 +167,9 @@ class MonitorPanel(ctk.CTkFrame):
                     text=f"{result.metrics.peak_memory_mb:.1f} MB"
                 )
             
-            if result.metrics.cpu_percent:
-                avg_cpu = sum(result.metrics.cpu_percent) / len(result.metrics.cpu_percent)
+            if result.metrics.cpu_samples:
                 self.metric_labels['cpu'].configure(
-                    text=f"{avg_cpu:.1f}%"
+                    text=f"{result.metrics.avg_cpu_percent:.1f}%"
                 )
         
         if result.exit_code is not None:
@@ -168,6 +178,29 @@ class MonitorPanel(ctk.CTkFrame):
                 text_color="green" if result.exit_code == 0 else "red"
             )
     
+    def _cancel_progress_callback(self):
+        """Cancel any pending progress animation callback."""
+        if self._progress_after_id is not None:
+            self.after_cancel(self._progress_after_id)
+            self._progress_after_id = None
+    
+    def _start_slow_pulse(self):
+        """Replace the per-frame indeterminate animation with a 1 Hz pulse."""
+        self._progress_after_id = None
+        if not self.timer_running:
+            return
+        self.progress_bar.stop()
+        self.progress_bar.configure(mode="determinate")
+        self._pulse()
+    
+    def _pulse(self, lit: bool = True):
+        """Toggle the progress bar between half and empty."""
+        if not self.timer_running:
+            self._progress_after_id = None
+            return
+        self.progress_bar.set(0.5 if lit else 0.0)
+        self._progress_after_id = self.after(self.PULSE_INTERVAL_MS, self._pulse, not lit)
+    
     def _update_timer(self):
         """Update the duration timer."""
         if self.timer_running and self.start_time:
@@ -181,6 +214,9 @@ class MonitorPanel(ctk.CTkFrame):
         """Reset the monitor to idle state."""
         self.timer_running = False
         self.start_time = None
+        self._cancel_progress_callback()
+        self.progress_bar.stop()
+        self.progress_bar.configure(mode="determinate")
         
         self.status_label.configure(text="Idle", text_color="gray")
         self.script_label.configure(text="-")
@@ -3,16 +3,20 @@ Parameter panel for dynamic parameter configuration.
 """
 
 import customtkinter as ctk
-from typing import Callable, Dict, Any, Optional
+from functools import lru_cache, partial
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from tkinter import filedialog
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).parent.parent))
 
 from core import ScriptMetadata, ParameterManager
 
 
+# Shared fonts, created on first use (CTkFont needs a Tk root)
+@lru_cache(maxsize=None)
+def _font(size: Optional[int] = None, weight: str = "normal") -> ctk.CTkFont:
+    """Return the shared font for a size and weight."""
+    return ctk.CTkFont(size=size, weight=weight)
+
+
 class ParameterPanel(ctk.CTkFrame):
     """Panel for configuring script parameters."""
     
@@ -22,7 +26,17 @@ class ParameterPanel(ctk.CTkFrame):
         self.on_launch = on_launch
         self.param_manager = ParameterManager()
         self.current_script: Optional[ScriptMetadata] = None
-        self.param_widgets: Dict[str, Any] = {}
+        self.param_widgets: Dict[str, Tuple[str, Any]] = {}  # name -> ('bool' or 'str', var)
+        
+        # Built parameter forms per script ID, reused when a script is reselected
+        self._panels: Dict[str, Tuple[ctk.CTkFrame, List]] = {}  # ID -> (form, parameters it shows)
+        self._widget_sets: Dict[str, Dict[str, Tuple[str, Any]]] = {}
+        self._shown_panel: Optional[ctk.CTkFrame] = None
+        self._pending_script_id: Optional[str] = None  # Script whose form build is queued
+        self._preset_cache: Dict[str, List[str]] = {}  # script ID -> preset names
+        
+        # Tk variables freed by discarded forms, reused by the next build
+        self._var_pool: Dict[str, List[Any]] = {'bool': [], 'str': []}
         
         self._create_ui()
     
@@ -32,7 +46,7 @@ class ParameterPanel(ctk.CTkFrame):
         self.header_label = ctk.CTkLabel(
             self,
             text="⚙️ Parameters",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=_font(16, "bold"),
             anchor="w"
         )
         self.header_label.pack(fill="x", padx=10, pady=(10, 5))
@@ -50,6 +64,13 @@ class ParameterPanel(ctk.CTkFrame):
         self.scrollable_frame = ctk.CTkScrollableFrame(self)
         self.scrollable_frame.pack(fill="both", expand=True, padx=10, pady=10)
         
+        # Shown while a script's form is being built
+        self._loading_label = ctk.CTkLabel(
+            self.scrollable_frame,
+            text="Loading parameters...",
+            text_color="gray"
+        )
+        
         # Bottom controls
         control_frame = ctk.CTkFrame(self, fg_color="transparent")
         control_frame.pack(fill="x", padx=10, pady=10)
@@ -82,7 +103,7 @@ class ParameterPanel(ctk.CTkFrame):
             control_frame,
             text="🚀 Launch Script",
             height=40,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
             command=self._launch,
             state="disabled"
         )
@@ -96,35 +117,106 @@ class ParameterPanel(ctk.CTkFrame):
         self.header_label.configure(text=f"⚙️ Parameters: {script.name}")
         self.info_label.configure(text=script.description)
         
-        # Clear existing widgets
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        self.param_widgets.clear()
-        
-        # Load presets
-        presets = self.param_manager.list_presets(script.id)
+        # Load presets, scanning the preset directory once per script
+        presets = self._preset_cache.get(script.id)
+        if presets is None:
+            presets = self._preset_cache[script.id] = self.param_manager.list_presets(script.id)
         self.preset_combo.configure(values=[""] + presets)
         self.preset_var.set("")
         
+        # Reuse the script's form unless its parameters have changed since
+        cached = self._panels.get(script.id)
+        if cached is not None and cached[1] is script.parameters:
+            self._pending_script_id = None
+            self.param_widgets = self._widget_sets[script.id]
+            self._show_panel(cached[0])
+            self.launch_button.configure(state="normal")
+        else:
+            # Build once the click has been drawn so selection feels instant
+            self._pending_script_id = script.id
+            self.param_widgets = {}
+            self.launch_button.configure(state="disabled")
+            self._show_panel(self._loading_label)
+            self.after_idle(self._build_params, script)
+    
+    def _build_params(self, script: ScriptMetadata):
+        """Build and show a script's form, unless another script was selected since."""
+        if self._pending_script_id != script.id:
+            return
+        self._pending_script_id = None
+        
+        cached = self._panels.get(script.id)
+        if cached is not None:
+            cached[0].destroy()
+            self._release_vars(self._widget_sets.pop(script.id))
+        
+        self._show_panel(self._build_panel(script))
+        
+        # Enable launch button
+        self.launch_button.configure(state="normal")
+        
+        # Lay out the new form in one pass; update_idletasks runs only pending
+        # geometry/redraw work, unlike update() which would also process input
+        self.scrollable_frame.update_idletasks()
+    
+    def _show_panel(self, panel):
+        """Swap the widget shown in the scrollable frame."""
+        if panel is not self._shown_panel:
+            if self._shown_panel is not None:
+                self._shown_panel.pack_forget()
+            panel.pack(fill="both", expand=True)
+            self._shown_panel = panel
+    
+    def _build_panel(self, script: ScriptMetadata) -> ctk.CTkFrame:
+        """Create the parameter form for a script and cache it."""
+        # The form stays unmapped while it is filled, so the scrollable
+        # frame lays out once when _show_panel packs it, not per widget
+        panel = ctk.CTkFrame(self.scrollable_frame, fg_color="transparent")
+        self.param_widgets = {}
+        
         # Create parameter inputs
         if not script.parameters:
             no_params_label = ctk.CTkLabel(
-                self.scrollable_frame,
+                panel,
                 text="This script has no parameters",
                 text_color="gray"
             )
             no_params_label.pack(pady=20)
         else:
             for param in script.parameters:
-                self._create_parameter_widget(param)
+                self._create_parameter_widget(panel, param)
         
-        # Enable launch button
-        self.launch_button.configure(state="normal")
+        self._panels[script.id] = (panel, script.parameters)
+        self._widget_sets[script.id] = self.param_widgets
+        return panel
+    
+    def _bool_var(self, value: bool) -> ctk.BooleanVar:
+        """Get a BooleanVar set to value, reusing a pooled one if possible."""
+        pool = self._var_pool['bool']
+        if pool:
+            var = pool.pop()
+            var.set(value)
+            return var
+        return ctk.BooleanVar(value=value)
+    
+    def _str_var(self, value: str) -> ctk.StringVar:
+        """Get a StringVar set to value, reusing a pooled one if possible."""
+        pool = self._var_pool['str']
+        if pool:
+            var = pool.pop()
+            var.set(value)
+            return var
+        return ctk.StringVar(value=value)
     
-    def _create_parameter_widget(self, param):
+    def _release_vars(self, widgets: Dict[str, Tuple[str, Any]]):
+        """Return a discarded form's variables to the pool."""
+        for kind, var in widgets.values():
+            self._var_pool[kind].append(var)
+    
+    def _create_parameter_widget(self, parent, param):
         """Create input widget for a parameter."""
         # Container frame
-        frame = ctk.CTkFrame(self.scrollable_frame, fg_color="transparent")
+        frame = ctk.CTkFrame(parent, fg_color="transparent")
         frame.pack(fill="x", pady=8)
         
         # Label
@@ -136,7 +228,7 @@ class ParameterPanel(ctk.CTkFrame):
             frame,
             text=label_text,
             anchor="w",
-            font=ctk.CTkFont(weight="bold")
+            font=_font(weight="bold")
         )
         label.pack(anchor="w")
         
@@ -147,120 +239,109 @@ class ParameterPanel(ctk.CTkFrame):
                 text=param.description,
                 anchor="w",
                 text_color="gray",
-                font=ctk.CTkFont(size=11)
+                font=_font(11)
             )
             desc_label.pack(anchor="w")
         
         # Input widget based on type
-        if param.type == 'bool':
-            var = ctk.BooleanVar(value=param.default or False)
-            widget = ctk.CTkCheckBox(frame, text="Enable", variable=var)
-            widget.pack(anchor="w", pady=5)
-            self.param_widgets[param.name] = var
-        
-        elif param.type == 'choice':
-            var = ctk.StringVar(value=param.default or (param.choices[0] if param.choices else ""))
-            widget = ctk.CTkComboBox(
-                frame,
-                variable=var,
-                values=param.choices or []
-            )
-            widget.pack(fill="x", pady=5)
-            self.param_widgets[param.name] = var
+        builder = self._BUILDERS.get(param.type, ParameterPanel._build_string)
+        kind = 'bool' if param.type == 'bool' else 'str'
+        self.param_widgets[param.name] = (kind, builder(self, frame, param))
+    
+    def _build_bool(self, frame, param) -> ctk.BooleanVar:
+        var = self._bool_var(param.default or False)
+        widget = ctk.CTkCheckBox(frame, text="Enable", variable=var)
+        widget.pack(anchor="w", pady=5)
+        return var
+    
+    def _build_choice(self, frame, param) -> ctk.StringVar:
+        var = self._str_var(param.default or (param.choices[0] if param.choices else ""))
+        widget = ctk.CTkComboBox(
+            frame,
+            variable=var,
+            values=param.choices or []
+        )
+        widget.pack(fill="x", pady=5)
+        return var
+    
+    def _build_file(self, frame, param) -> ctk.StringVar:
+        return self._build_browse_row(frame, param, filedialog.askopenfilename)
+    
+    def _build_directory(self, frame, param) -> ctk.StringVar:
+        return self._build_browse_row(frame, param, filedialog.askdirectory)
+    
+    def _build_browse_row(self, frame, param, ask: Callable[[], str]) -> ctk.StringVar:
+        """Create a path entry with a Browse button that fills it from ask()."""
+        var = self._str_var(param.default or "")
         
-        elif param.type == 'file':
-            var = ctk.StringVar(value=param.default or "")
-            
-            input_frame = ctk.CTkFrame(frame, fg_color="transparent")
-            input_frame.pack(fill="x", pady=5)
-            
-            entry = ctk.CTkEntry(input_frame, textvariable=var)
-            entry.pack(side="left", fill="x", expand=True, padx=(0, 5))
-            
-            browse_btn = ctk.CTkButton(
-                input_frame,
-                text="Browse",
-                width=80,
-                command=lambda: self._browse_file(var)
-            )
-            browse_btn.pack(side="right")
-            
-            self.param_widgets[param.name] = var
+        input_frame = ctk.CTkFrame(frame, fg_color="transparent")
+        input_frame.pack(fill="x", pady=5)
         
-        elif param.type == 'directory':
-            var = ctk.StringVar(value=param.default or "")
-            
-            input_frame = ctk.CTkFrame(frame, fg_color="transparent")
-            input_frame.pack(fill="x", pady=5)
-            
-            entry = ctk.CTkEntry(input_frame, textvariable=var)
-            entry.pack(side="left", fill="x", expand=True, padx=(0, 5))
-            
-            browse_btn = ctk.CTkButton(
-                input_frame,
-                text="Browse",
-                width=80,
-                command=lambda: self._browse_directory(var)
-            )
-            browse_btn.pack(side="right")
-            
-            self.param_widgets[param.name] = var
+        entry = ctk.CTkEntry(input_frame, textvariable=var)
+        entry.pack(side="left", fill="x", expand=True, padx=(0, 5))
         
-        elif param.type in ('int', 'float'):
-            var = ctk.StringVar(value=str(param.default) if param.default is not None else "")
-            entry = ctk.CTkEntry(frame, textvariable=var)
-            entry.pack(fill="x", pady=5)
-            
-            # Add range hint
-            if param.min_value is not None or param.max_value is not None:
-                range_text = "Range: "
-                if param.min_value is not None:
-                    range_text += f"≥ {param.min_value}"
-                if param.max_value is not None:
-                    if param.min_value is not None:
-                        range_text += ", "
-                    range_text += f"≤ {param.max_value}"
-                
-                range_label = ctk.CTkLabel(
-                    frame,
-                    text=range_text,
-                    text_color="gray",
-                    font=ctk.CTkFont(size=10)
-                )
-                range_label.pack(anchor="w")
-            
-            self.param_widgets[param.name] = var
+        browse_btn = ctk.CTkButton(
+            input_frame,
+            text="Browse",
+            width=80,
+            command=partial(self._browse, var, ask)
+        )
+        browse_btn.pack(side="right")
         
-        else:  # string
-            var = ctk.StringVar(value=param.default or "")
-            entry = ctk.CTkEntry(frame, textvariable=var)
-            entry.pack(fill="x", pady=5)
-            self.param_widgets[param.name] = var
+        return var
+    
+    def _build_number(self, frame, param) -> ctk.StringVar:
+        var = self._str_var(str(param.default) if param.default is not None else "")
+        entry = ctk.CTkEntry(frame, textvariable=var)
+        entry.pack(fill="x", pady=5)
+        
+        # Add range hint
+        bounds = []
+        if param.min_value is not None:
+            bounds.append(f"≥ {param.min_value}")
+        if param.max_value is not None:
+            bounds.append(f"≤ {param.max_value}")
+        if bounds:
+            range_label = ctk.CTkLabel(
+                frame,
+                text="Range: " + ", ".join(bounds),
+                text_color="gray",
+                font=_font(10)
+            )
+            range_label.pack(anchor="w")
+        
+        return var
+    
+    def _build_string(self, frame, param) -> ctk.StringVar:
+        var = self._str_var(param.default or "")
+        entry = ctk.CTkEntry(frame, textvariable=var)
+        entry.pack(fill="x", pady=5)
+        return var
     
-    def _browse_file(self, var: ctk.StringVar):
-        """Browse for a file."""
-        filename = filedialog.askopenfilename()
-        if filename:
-            var.set(filename)
+    # Parameter type -> builder(self, frame, param) returning the input's variable;
+    # unknown types get a plain string entry
+    _BUILDERS = {
+        'bool': _build_bool,
+        'choice': _build_choice,
+        'file': _build_file,
+        'directory': _build_directory,
+        'int': _build_number,
+        'float': _build_number,
+        'string': _build_string,
+    }
     
-    def _browse_directory(self, var: ctk.StringVar):
-        """Browse for a directory."""
-        dirname = filedialog.askdirectory()
-        if dirname:
-            var.set(dirname)
+    def _browse(self, var: ctk.StringVar, ask: Callable[[], str]):
+        """Browse for a path and store it in var."""
+        path = ask()
+        if path:
+            var.set(path)
     
     def _get_parameter_values(self) -> Dict[str, Any]:
         """Get current parameter values."""
-        values = {}
-        for name, widget in self.param_widgets.items():
-            if isinstance(widget, ctk.BooleanVar):
-                values[name] = widget.get()
-            elif isinstance(widget, ctk.StringVar):
-                value = widget.get()
-                values[name] = value if value else None
-            else:
-                values[name] = widget.get()
-        return values
+        return {
+            name: var.get() if kind == 'bool' else (var.get() or None)
+            for name, (kind, var) in self.param_widgets.items()
+        }
     
     def _launch(self):
         """Launch the script with current parameters."""
@@ -293,6 +374,7 @@ class ParameterPanel(ctk.CTkFrame):
             if success:
                 # Refresh preset list
                 presets = self.param_manager.list_presets(self.current_script.id)
+                self._preset_cache[self.current_script.id] = presets
                 self.preset_combo.configure(values=[""] + presets)
                 self.preset_var.set(preset_name)
     
@@ -306,9 +388,9 @@ class ParameterPanel(ctk.CTkFrame):
             # Set parameter values
             for name, value in values.items():
                 if name in self.param_widgets:
-                    widget = self.param_widgets[name]
-                    if isinstance(widget, ctk.BooleanVar):
-                        widget.set(bool(value))
-                    elif isinstance(widget, ctk.StringVar):
-                        widget.set(str(value) if value is not None else "")
+                    kind, var = self.param_widgets[name]
+                    if kind == 'bool':
+                        var.set(bool(value))
+                    else:
+                        var.set(str(value) if value is not None else "")
 
@@ -4,19 +4,43 @@ Dialog for registering new scripts.
 
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
-import sys
+import os
+import threading
 from pathlib import Path
-
-sys.path.append(str(Path(__file__).parent.parent))
+from typing import Optional, Tuple
 
 from core import ScriptMetadata, ScriptParameter, get_registry
 
 
+# Shared bold font, created on first use (CTkFont needs a Tk root)
+_BOLD = None
+
+
+def _bold() -> ctk.CTkFont:
+    """Return the shared bold font."""
+    global _BOLD
+    if _BOLD is None:
+        _BOLD = ctk.CTkFont(weight="bold")
+    return _BOLD
+
+
 class RegisterDialog:
     """Dialog for registering a new script."""
     
+    __slots__ = (
+        "registry", "dialog", "_path_check_id", "_path_status",
+        "name_entry", "path_entry", "path_status_label", "desc_text",
+        "author_entry", "version_entry", "tags_entry", "timeout_entry",
+        "wd_entry", "register_button",
+    )
+    
+    # Delay after the last keystroke before checking the script path
+    PATH_CHECK_DELAY_MS = 300
+    
     def __init__(self, parent):
         self.registry = get_registry()
+        self._path_check_id: Optional[str] = None
+        self._path_status: Optional[Tuple[str, bool]] = None  # (path, is_file)
         
         # Create dialog window
         self.dialog = ctk.CTkToplevel(parent)
@@ -34,48 +58,52 @@ class RegisterDialog:
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
         
         # Script name
-        ctk.CTkLabel(main_frame, text="Script Name *", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(0, 5))
+        ctk.CTkLabel(main_frame, text="Script Name *", font=_bold()).pack(anchor="w", pady=(0, 5))
         self.name_entry = ctk.CTkEntry(main_frame, placeholder_text="My Script")
         self.name_entry.pack(fill="x", pady=(0, 15))
         
         # Script path
-        ctk.CTkLabel(main_frame, text="Script Path *", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(0, 5))
+        ctk.CTkLabel(main_frame, text="Script Path *", font=_bold()).pack(anchor="w", pady=(0, 5))
         path_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
         path_frame.pack(fill="x", pady=(0, 15))
         
         self.path_entry = ctk.CTkEntry(path_frame, placeholder_text="/path/to/script.py")
         self.path_entry.pack(side="left", fill="x", expand=True, padx=(0, 5))
+        self.path_entry.bind("<KeyRelease>", self._schedule_path_check)
         
         ctk.CTkButton(path_frame, text="Browse", width=80, command=self._browse_script).pack(side="right")
         
+        self.path_status_label = ctk.CTkLabel(path_frame, text="", width=20)
+        self.path_status_label.pack(side="right", padx=(0, 5))
+        
         # Description
-        ctk.CTkLabel(main_frame, text="Description *", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(0, 5))
+        ctk.CTkLabel(main_frame, text="Description *", font=_bold()).pack(anchor="w", pady=(0, 5))
         self.desc_text = ctk.CTkTextbox(main_frame, height=80)
         self.desc_text.pack(fill="x", pady=(0, 15))
         
         # Author
-        ctk.CTkLabel(main_frame, text="Author", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(0, 5))
+        ctk.CTkLabel(main_frame, text="Author", font=_bold()).pack(anchor="w", pady=(0, 5))
         self.author_entry = ctk.CTkEntry(main_frame, placeholder_text="Your Name")
         self.author_entry.pack(fill="x", pady=(0, 15))
         
         # Version
-        ctk.CTkLabel(main_frame, text="Version", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(0, 5))
+        ctk.CTkLabel(main_frame, text="Version", font=_bold()).pack(anchor="w", pady=(0, 5))
         self.version_entry = ctk.CTkEntry(main_frame, placeholder_text="1.0.0")
         self.version_entry.insert(0, "1.0.0")
         self.version_entry.pack(fill="x", pady=(0, 15))
         
         # Tags
-        ctk.CTkLabel(main_frame, text="Tags (comma-separated)", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(0, 5))
+        ctk.CTkLabel(main_frame, text="Tags (comma-separated)", font=_bold()).pack(anchor="w", pady=(0, 5))
         self.tags_entry = ctk.CTkEntry(main_frame, placeholder_text="automation, data-processing")
         self.tags_entry.pack(fill="x", pady=(0, 15))
         
         # Timeout
-        ctk.CTkLabel(main_frame, text="Timeout (seconds, optional)", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(0, 5))
+        ctk.CTkLabel(main_frame, text="Timeout (seconds, optional)", font=_bold()).pack(anchor="w", pady=(0, 5))
         self.timeout_entry = ctk.CTkEntry(main_frame, placeholder_text="300")
         self.timeout_entry.pack(fill="x", pady=(0, 15))
         
         # Working directory
-        ctk.CTkLabel(main_frame, text="Working Directory (optional)", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(0, 5))
+        ctk.CTkLabel(main_frame, text="Working Directory (optional)", font=_bold()).pack(anchor="w", pady=(0, 5))
         wd_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
         wd_frame.pack(fill="x", pady=(0, 15))
         
@@ -95,11 +123,12 @@ class RegisterDialog:
             fg_color="gray"
         ).pack(side="right", padx=5)
         
-        ctk.CTkButton(
+        self.register_button = ctk.CTkButton(
             button_frame,
             text="Register",
             command=self._register
-        ).pack(side="right", padx=5)
+        )
+        self.register_button.pack(side="right", padx=5)
     
     def _browse_script(self):
         """Browse for script file."""
@@ -110,12 +139,44 @@ class RegisterDialog:
         if filename:
             self.path_entry.delete(0, 'end')
             self.path_entry.insert(0, filename)
+            self._schedule_path_check()
             
             # Auto-fill name if empty
             if not self.name_entry.get():
                 script_name = Path(filename).stem.replace('_', ' ').title()
                 self.name_entry.insert(0, script_name)
     
+    def _schedule_path_check(self, event=None):
+        """Debounce path validation until typing pauses."""
+        if self._path_check_id is not None:
+            self.dialog.after_cancel(self._path_check_id)
+        self._path_check_id = self.dialog.after(self.PATH_CHECK_DELAY_MS, self._check_path_async)
+    
+    def _check_path_async(self):
+        """Stat the entered path on a worker thread."""
+        self._path_check_id = None
+        path = self.path_entry.get().strip()
+        if not path:
+            self._path_status = None
+            self.path_status_label.configure(text="")
+            return
+        
+        def check():
+            exists = os.path.isfile(path)
+            self.dialog.after(0, self._on_path_checked, path, exists)
+        
+        threading.Thread(target=check, daemon=True).start()
+    
+    def _on_path_checked(self, path: str, exists: bool):
+        """Show the path check result, ignoring stale checks."""
+        if path != self.path_entry.get().strip():
+            return
+        self._path_status = (path, exists)
+        self.path_status_label.configure(
+            text="✓" if exists else "✗",
+            text_color="green" if exists else "red"
+        )
+    
     def _browse_directory(self):
         """Browse for working directory."""
         dirname = filedialog.askdirectory(title="Select Working Directory")
@@ -142,14 +203,15 @@ class RegisterDialog:
             messagebox.showerror("Error", "Description is required")
             return
         
-        # Check if file exists
-        if not Path(path).exists():
+        # Use the pre-computed path check when it matches the submitted path
+        if self._path_status == (path, False):
             messagebox.showerror("Error", f"Script file not found: {path}")
             return
+        path_checked = self._path_status == (path, True)
         
         # Parse tags
         tags_str = self.tags_entry.get().strip()
-        tags = [t.strip() for t in tags_str.split(',') if t.strip()]
+        tags = list(filter(None, (t.strip() for t in tags_str.split(','))))
         
         # Parse timeout
         timeout_str = self.timeout_entry.get().strip()
@@ -179,11 +241,31 @@ class RegisterDialog:
             working_directory=working_dir
         )
         
-        # Register
+        # Filesystem check and registry write can block on slow disks,
+        # so run them off the Tk main thread
+        self.register_button.configure(state="disabled")
+        threading.Thread(
+            target=self._do_register, args=(metadata, path_checked), daemon=True
+        ).start()
+    
+    def _do_register(self, metadata: ScriptMetadata, path_checked: bool = False):
+        """Check the script path and register it (runs on a worker thread)."""
         try:
-            script_id = self.registry.register_script(metadata)
-            messagebox.showinfo("Success", f"Script registered successfully!\nID: {script_id}")
-            self.dialog.destroy()
+            if not path_checked and not os.path.isfile(metadata.path):
+                result = (False, f"Script file not found: {metadata.path}")
+            else:
+                result = (True, self.registry.register_script(metadata))
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to register script: {e}")
-
+            result = (False, f"Failed to register script: {e}")
+        
+        self.dialog.after(0, self._on_register_done, result)
+    
+    def _on_register_done(self, result: tuple):
+        """Report the registration outcome on the Tk main thread."""
+        success, detail = result
+        if success:
+            messagebox.showinfo("Success", f"Script registered successfully!\nID: {detail}")
+            self.dialog.destroy()
+        else:
+            self.register_button.configure(state="normal")
+            messagebox.showerror("Error", detail)
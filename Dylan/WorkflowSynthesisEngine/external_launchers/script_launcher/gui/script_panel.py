@@ -3,25 +3,38 @@ Script panel for displaying and selecting registered scripts.
 """
 
 import customtkinter as ctk
-from typing import Callable, Optional
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).parent.parent))
+import tkinter as tk
+from functools import partial
+from typing import Callable, List, Optional
 
 from core import get_registry
 
+# Script row button colors (light, dark)
+FG_SELECTED = ("green", "darkgreen")
+FG_DISABLED = ("gray75", "gray25")
+FG_NORMAL = ("gray70", "gray30")
+
 
 class ScriptPanel(ctk.CTkFrame):
     """Panel for displaying and managing scripts."""
     
+    # Height of one script row: 60px button plus 5px padding above and below
+    ROW_HEIGHT = 70
+    INFO_WIDTH = 40
+    
+    # Delay before a search or filter change refreshes the list
+    REFRESH_DEBOUNCE_MS = 150
+    
     def __init__(self, parent, on_select: Callable[[str], None]):
         super().__init__(parent)
         
         self.registry = get_registry()
         self.on_select = on_select
         self.selected_script_id: Optional[str] = None
-        self.script_buttons = {}
+        self._scripts = []  # Filtered, sorted scripts backing the list
+        self._scripts_key = None  # (registry version, search, filter) _scripts was built for
+        self._rows: List[list] = []  # [button_window, info_window, button, info_button, bound_key]
+        self._refresh_after = None  # Pending debounced refresh
         
         self._create_ui()
         self.refresh()
@@ -39,7 +52,7 @@ class ScriptPanel(ctk.CTkFrame):
         
         # Search box
         self.search_var = ctk.StringVar()
-        self.search_var.trace("w", lambda *args: self.refresh())
+        self.search_var.trace("w", lambda *args: self._schedule_refresh())
         
         search_entry = ctk.CTkEntry(
             self,
@@ -59,7 +72,7 @@ class ScriptPanel(ctk.CTkFrame):
             text="All",
             variable=self.filter_var,
             value="all",
-            command=self.refresh
+            command=self._schedule_refresh
         ).pack(side="left", padx=5)
         
         ctk.CTkRadioButton(
@@ -67,12 +80,29 @@ class ScriptPanel(ctk.CTkFrame):
             text="Enabled",
             variable=self.filter_var,
             value="enabled",
-            command=self.refresh
+            command=self._schedule_refresh
         ).pack(side="left", padx=5)
         
-        # Scrollable frame for scripts
-        self.scrollable_frame = ctk.CTkScrollableFrame(self)
-        self.scrollable_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        # Virtualized script list: only enough rows to fill the viewport
+        # exist, and they are rebound to scripts as the list scrolls
+        self.list_frame = ctk.CTkFrame(self)
+        self.list_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        self._canvas = tk.Canvas(
+            self.list_frame,
+            highlightthickness=0,
+            bd=0,
+            bg=self._list_bg(),
+            yscrollincrement=self.ROW_HEIGHT // 2
+        )
+        self._scrollbar = ctk.CTkScrollbar(self.list_frame, command=self._canvas.yview)
+        self._scrollbar.pack(side="right", fill="y")
+        self._canvas.pack(side="left", fill="both", expand=True, padx=(5, 0), pady=5)
+        self._canvas.configure(yscrollcommand=self._on_canvas_scroll)
+        self._canvas.bind("<Configure>", self._on_canvas_configure)
+        self.bind_all("<MouseWheel>", self._on_mousewheel, add="+")
+        self.bind_all("<Button-4>", self._on_mousewheel, add="+")
+        self.bind_all("<Button-5>", self._on_mousewheel, add="+")
         
         # Count label
         self.count_label = ctk.CTkLabel(
@@ -83,80 +113,167 @@ class ScriptPanel(ctk.CTkFrame):
         )
         self.count_label.pack(pady=(0, 10))
     
+    def _list_bg(self) -> str:
+        """Background color of the list area for the current appearance mode."""
+        return self.list_frame._apply_appearance_mode(self.list_frame.cget("fg_color"))
+    
+    def _set_appearance_mode(self, mode_string):
+        super()._set_appearance_mode(mode_string)
+        self._canvas.configure(bg=self._list_bg())
+    
+    def _schedule_refresh(self):
+        """Refresh once input settles, coalescing a burst of keystrokes."""
+        if self._refresh_after:
+            self.after_cancel(self._refresh_after)
+        self._refresh_after = self.after(self.REFRESH_DEBOUNCE_MS, self._do_refresh)
+    
     def refresh(self):
-        """Refresh the script list."""
-        # Clear existing buttons
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        self.script_buttons.clear()
+        """Refresh the script list now, dropping any pending debounced refresh."""
+        if self._refresh_after:
+            self.after_cancel(self._refresh_after)
+        self._do_refresh()
+    
+    def _do_refresh(self):
+        """Rebuild the filtered script list."""
+        self._refresh_after = None
         
-        # Get scripts based on filter
+        # Get scripts based on filter, reusing the last sorted list if
+        # neither the registry nor the filter has changed since
         search_query = self.search_var.get().strip()
         filter_mode = self.filter_var.get()
+        key = (self.registry.version(), search_query, filter_mode)
         
-        if search_query:
-            scripts = self.registry.search_scripts(search_query)
-        elif filter_mode == "enabled":
-            scripts = self.registry.get_enabled_scripts()
-        else:
-            scripts = self.registry.get_all_scripts()
+        if key != self._scripts_key:
+            if search_query:
+                scripts = self.registry.search_scripts(search_query)
+            elif filter_mode == "enabled":
+                scripts = self.registry.iter_enabled_scripts()
+            else:
+                scripts = self.registry.scripts_snapshot()
+            
+            # Sort by name
+            self._scripts = sorted(scripts, key=lambda s: s.name.lower())
+            self._scripts_key = key
         
-        # Sort by name
-        scripts = sorted(scripts, key=lambda s: s.name.lower())
+        # Size the scroll region for the whole list, keeping the scroll
+        # position unless the list got shorter than it
+        total_height = len(self._scripts) * self.ROW_HEIGHT
+        self._canvas.configure(scrollregion=(0, 0, 0, total_height))
+        if self._canvas.canvasy(0) + self._canvas.winfo_height() > total_height:
+            self._canvas.yview_moveto(0)
         
-        # Create buttons for each script
-        for script in scripts:
-            self._create_script_button(script)
+        # Scripts may have changed in place, so rebind every row
+        for row in self._rows:
+            row[4] = None
+        self._repaint()
         
         # Update count
-        self.count_label.configure(text=f"{len(scripts)} script{'s' if len(scripts) != 1 else ''}")
-    
-    def _create_script_button(self, script):
-        """Create a button for a script."""
-        # Container frame
-        frame = ctk.CTkFrame(self.scrollable_frame)
-        frame.pack(fill="x", pady=5)
-        
-        # Main button
-        btn_text = f"{'✓' if script.enabled else '✗'} {script.name}"
-        if script.tags:
-            btn_text += f"\n🏷️ {', '.join(script.tags[:3])}"
-        
-        button = ctk.CTkButton(
-            frame,
-            text=btn_text,
-            anchor="w",
-            height=60,
-            command=lambda: self._select_script(script.id),
-            fg_color=("gray75", "gray25") if not script.enabled else None
+        count = len(self._scripts)
+        self.count_label.configure(text=f"{count} script{'s' if count != 1 else ''}")
+        
+        # Lay out the rebound rows in one pass; update_idletasks runs only pending
+        # geometry/redraw work, unlike update() which would also process input
+        self._canvas.update_idletasks()
+    
+    def _create_row(self) -> list:
+        """Create one reusable row, initially hidden."""
+        # Both buttons sit directly on the canvas; no per-row container frame
+        button = ctk.CTkButton(self._canvas, text="", anchor="w", height=60)
+        info_btn = ctk.CTkButton(self._canvas, text="ℹ️", width=self.INFO_WIDTH)
+        
+        button_window = self._canvas.create_window(
+            0, 0, window=button, anchor="nw",
+            width=self._main_width(), state="hidden"
         )
-        button.pack(fill="x", side="left", expand=True, padx=(0, 5))
-        
-        # Info button
-        info_btn = ctk.CTkButton(
-            frame,
-            text="ℹ️",
-            width=40,
-            command=lambda: self._show_script_info(script)
+        info_window = self._canvas.create_window(
+            0, 0, window=info_btn, anchor="nw", state="hidden"
         )
-        info_btn.pack(side="right")
+        return [button_window, info_window, button, info_btn, None]
+    
+    def _main_width(self) -> int:
+        """Width of a row's main button, leaving room for the info button."""
+        return max(1, self._canvas.winfo_width() - self.INFO_WIDTH - 5)
+    
+    def _row_color(self, script):
+        """Button color for a script given the current selection."""
+        if script.id == self.selected_script_id:
+            return FG_SELECTED
+        if not script.enabled:
+            return FG_DISABLED
+        if self.selected_script_id is not None:
+            return FG_NORMAL
+        return ctk.ThemeManager.theme["CTkButton"]["fg_color"]
+    
+    def _repaint(self):
+        """Bind the row pool to the scripts currently in view."""
+        # Enough rows to cover the viewport even when it straddles two rows
+        needed = self._canvas.winfo_height() // self.ROW_HEIGHT + 2
+        while len(self._rows) < needed:
+            self._rows.append(self._create_row())
         
-        self.script_buttons[script.id] = button
+        info_x = self._canvas.winfo_width() - self.INFO_WIDTH
+        first = max(0, int(self._canvas.canvasy(0)) // self.ROW_HEIGHT)
+        for offset, row in enumerate(self._rows):
+            button_window, info_window, button, info_btn, bound_key = row
+            index = first + offset
+            if index >= len(self._scripts):
+                self._canvas.itemconfigure(button_window, state="hidden")
+                self._canvas.itemconfigure(info_window, state="hidden")
+                row[4] = None
+                continue
+            
+            script = self._scripts[index]
+            y = index * self.ROW_HEIGHT + 5
+            self._canvas.coords(button_window, 0, y)
+            self._canvas.coords(info_window, info_x, y)
+            
+            color = self._row_color(script)
+            key = (script.id, color)
+            if key != bound_key:
+                btn_text = f"{'✓' if script.enabled else '✗'} {script.name}"
+                if script.tags:
+                    btn_text += f"\n🏷️ {', '.join(script.tags[:3])}"
+                button.configure(
+                    text=btn_text,
+                    fg_color=color,
+                    command=partial(self._select_script, script.id)
+                )
+                info_btn.configure(command=partial(self._show_script_info, script))
+                row[4] = key
+            
+            self._canvas.itemconfigure(button_window, state="normal")
+            self._canvas.itemconfigure(info_window, state="normal")
+    
+    def _on_canvas_scroll(self, first, last):
+        """Keep the scrollbar in sync and show the rows now in view."""
+        self._scrollbar.set(first, last)
+        self._repaint()
+    
+    def _on_canvas_configure(self, event):
+        """Stretch rows to the list width and fill a taller viewport."""
+        main_width = self._main_width()
+        for button_window, *_ in self._rows:
+            self._canvas.itemconfigure(button_window, width=main_width)
+        self._repaint()
+    
+    def _on_mousewheel(self, event):
+        """Scroll the list when the wheel turns over it."""
+        if not str(event.widget).startswith(str(self._canvas)):
+            return
+        if event.num == 4:
+            step = -1
+        elif event.num == 5:
+            step = 1
+        else:
+            step = -1 if event.delta > 0 else 1
+        self._canvas.yview_scroll(step, "units")
     
     def _select_script(self, script_id: str):
         """Select a script."""
-        self.selected_script_id = script_id
-        
-        # Update button colors
-        for sid, button in self.script_buttons.items():
-            if sid == script_id:
-                button.configure(fg_color=("green", "darkgreen"))
-            else:
-                script = self.registry.get_script(sid)
-                if script and not script.enabled:
-                    button.configure(fg_color=("gray75", "gray25"))
-                else:
-                    button.configure(fg_color=("gray70", "gray30"))
+        # Row colors depend only on the selection, so a repeat click skips them
+        if script_id != self.selected_script_id:
+            self.selected_script_id = script_id
+            self._repaint()
         
         # Notify parent
         self.on_select(script_id)
@@ -165,16 +282,21 @@ class ScriptPanel(ctk.CTkFrame):
         """Show detailed script information."""
         from tkinter import messagebox
         
-        info = f"Name: {script.name}\n"
-        info += f"Version: {script.version}\n"
-        info += f"Author: {script.author}\n\n"
-        info += f"Description:\n{script.description}\n\n"
-        info += f"Path: {script.path}\n"
-        info += f"Parameters: {len(script.parameters)}\n"
-        info += f"Runs: {script.run_count} (✓{script.success_count} ✗{script.failure_count})\n"
+        lines = [
+            f"Name: {script.name}",
+            f"Version: {script.version}",
+            f"Author: {script.author}",
+            "",
+            "Description:",
+            script.description,
+            "",
+            f"Path: {script.path}",
+            f"Parameters: {len(script.parameters)}",
+            f"Runs: {script.run_count} (✓{script.success_count} ✗{script.failure_count})",
+        ]
         
         if script.last_run:
-            info += f"Last run: {script.last_run}\n"
+            lines.append(f"Last run: {script.last_run}")
         
-        messagebox.showinfo(f"Script Info: {script.name}", info)
+        messagebox.showinfo(f"Script Info: {script.name}", "\n".join(lines) + "\n")
 
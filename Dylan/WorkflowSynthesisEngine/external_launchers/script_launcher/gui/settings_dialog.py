@@ -3,9 +3,18 @@ Settings dialog for application configuration.
 """
 
 import customtkinter as ctk
+from functools import lru_cache, partial
+from typing import Optional
 from tkinter import messagebox
 
 
+# Shared fonts, created on first use (CTkFont needs a Tk root)
+@lru_cache(maxsize=None)
+def _font(size: Optional[int] = None, weight: str = "normal") -> ctk.CTkFont:
+    """Return the shared font for a size and weight."""
+    return ctk.CTkFont(size=size, weight=weight)
+
+
 class SettingsDialog:
     """Dialog for application settings."""
     
@@ -25,16 +34,60 @@ class SettingsDialog:
         main_frame = ctk.CTkFrame(self.dialog)
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
         
-        # Appearance
-        ctk.CTkLabel(
-            main_frame,
-            text="Appearance",
-            font=ctk.CTkFont(size=16, weight="bold")
-        ).pack(anchor="w", pady=(0, 10))
+        # Collapsible sections; each body is built the first time it is opened
+        self._sections = {
+            'Appearance': self._build_appearance,
+            'Logging': self._build_logging,
+            'Execution': self._build_execution,
+        }
+        self._section_widgets = {}  # title -> (header button, body frame)
+        self._built_sections = set()
+        
+        for title in self._sections:
+            header = ctk.CTkButton(
+                main_frame,
+                text=f"▸ {title}",
+                font=_font(16, "bold"),
+                anchor="w",
+                fg_color="transparent",
+                text_color=("gray10", "gray90"),
+                command=partial(self._toggle_section, title)
+            )
+            header.pack(fill="x", pady=(0, 10))
+            self._section_widgets[title] = (header, ctk.CTkFrame(main_frame))
+        
+        # Buttons
+        button_frame = ctk.CTkFrame(self.dialog, fg_color="transparent")
+        button_frame.pack(fill="x", padx=20, pady=20)
         
-        appearance_frame = ctk.CTkFrame(main_frame)
-        appearance_frame.pack(fill="x", pady=(0, 20))
+        ctk.CTkButton(
+            button_frame,
+            text="Close",
+            command=self.dialog.destroy
+        ).pack(side="right", padx=5)
         
+        ctk.CTkButton(
+            button_frame,
+            text="Save",
+            command=self._save_settings
+        ).pack(side="right", padx=5)
+    
+    def _toggle_section(self, title: str):
+        """Expand or collapse a section, building it on first expansion."""
+        header, body = self._section_widgets[title]
+        if body.winfo_manager():
+            body.pack_forget()
+            header.configure(text=f"▸ {title}")
+            return
+        
+        if title not in self._built_sections:
+            self._sections[title](body)
+            self._built_sections.add(title)
+        body.pack(fill="x", pady=(0, 20), after=header)
+        header.configure(text=f"▾ {title}")
+    
+    def _build_appearance(self, appearance_frame):
+        """Create the Appearance section."""
         ctk.CTkLabel(appearance_frame, text="Theme:").grid(row=0, column=0, sticky="w", padx=10, pady=10)
         
         self.theme_var = ctk.StringVar(value=ctk.get_appearance_mode())
@@ -45,17 +98,9 @@ class SettingsDialog:
             command=self._change_theme
         )
         theme_menu.grid(row=0, column=1, sticky="w", padx=10, pady=10)
-        
-        # Logging
-        ctk.CTkLabel(
-            main_frame,
-            text="Logging",
-            font=ctk.CTkFont(size=16, weight="bold")
-        ).pack(anchor="w", pady=(0, 10))
-        
-        logging_frame = ctk.CTkFrame(main_frame)
-        logging_frame.pack(fill="x", pady=(0, 20))
-        
+    
+    def _build_logging(self, logging_frame):
+        """Create the Logging section."""
         self.log_level_var = ctk.StringVar(value="INFO")
         ctk.CTkLabel(logging_frame, text="Log Level:").grid(row=0, column=0, sticky="w", padx=10, pady=10)
         
@@ -65,38 +110,14 @@ class SettingsDialog:
             values=["DEBUG", "INFO", "WARNING", "ERROR"]
         )
         log_menu.grid(row=0, column=1, sticky="w", padx=10, pady=10)
-        
-        # Execution
-        ctk.CTkLabel(
-            main_frame,
-            text="Execution",
-            font=ctk.CTkFont(size=16, weight="bold")
-        ).pack(anchor="w", pady=(0, 10))
-        
-        exec_frame = ctk.CTkFrame(main_frame)
-        exec_frame.pack(fill="x", pady=(0, 20))
-        
+    
+    def _build_execution(self, exec_frame):
+        """Create the Execution section."""
         self.default_timeout_var = ctk.StringVar(value="300")
         ctk.CTkLabel(exec_frame, text="Default Timeout (s):").grid(row=0, column=0, sticky="w", padx=10, pady=10)
         
         timeout_entry = ctk.CTkEntry(exec_frame, textvariable=self.default_timeout_var, width=100)
         timeout_entry.grid(row=0, column=1, sticky="w", padx=10, pady=10)
-        
-        # Buttons
-        button_frame = ctk.CTkFrame(self.dialog, fg_color="transparent")
-        button_frame.pack(fill="x", padx=20, pady=20)
-        
-        ctk.CTkButton(
-            button_frame,
-            text="Close",
-            command=self.dialog.destroy
-        ).pack(side="right", padx=5)
-        
-        ctk.CTkButton(
-            button_frame,
-            text="Save",
-            command=self._save_settings
-        ).pack(side="right", padx=5)
     
     def _change_theme(self, theme: str):
         """Change application theme."""
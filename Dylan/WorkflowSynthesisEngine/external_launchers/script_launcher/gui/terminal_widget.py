@@ -5,7 +5,12 @@ Terminal widget for displaying live script output with ANSI color support.
 import customtkinter as ctk
 import tkinter as tk
 from datetime import datetime
+from typing import List, Tuple
 import re
+import threading
+
+# Every ANSI sequence starts with ESC; text without it needs no parsing
+_ESC = '\x1B'
 
 
 class TerminalWidget(ctk.CTkFrame):
@@ -19,9 +24,22 @@ class TerminalWidget(ctk.CTkFrame):
         '94': '#5599ff', '95': 'lightmagenta', '96': 'lightcyan', '97': 'lightgray'
     }
     
+    # ANSI color code -> text tag name
+    _ANSI_TAG = {code: f'ansi_{code}' for code in ANSI_COLORS}
+    
+    # ANSI escape patterns, compiled once for all writes
+    _ANSI_STRIP_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+    _ANSI_PARSE_RE = re.compile(r'\x1B\[([0-9;]+)m')
+    
     def __init__(self, parent):
         super().__init__(parent)
         
+        # Stream lines waiting for the next idle flush; written from reader threads
+        self._pending: List[Tuple[str, str]] = []
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
+        self._scroll_pending = False
+        
         self._create_ui()
         self._configure_tags()
     
@@ -101,74 +119,116 @@ class TerminalWidget(ctk.CTkFrame):
         
         # ANSI colors
         for code, color_name in self.ANSI_COLORS.items():
-            self.text_widget.tag_config(f'ansi_{code}', foreground=color_name)
+            self.text_widget.tag_config(self._ANSI_TAG[code], foreground=color_name)
     
     def _strip_ansi_codes(self, text: str) -> str:
         """Remove ANSI escape codes from text."""
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        return ansi_escape.sub('', text)
+        if _ESC not in text:
+            return text
+        return self._ANSI_STRIP_RE.sub('', text)
     
     def _parse_ansi_text(self, text: str) -> list:
         """Parse text with ANSI codes into segments."""
+        if _ESC not in text:
+            return [(text, ())]
+        
         # Simple ANSI parser for basic color support
-        ansi_pattern = re.compile(r'\x1B\[([0-9;]+)m')
+        # Tags are immutable tuples, so segments can share them without copying
         segments = []
         current_pos = 0
-        current_tags = []
+        current_tags = ()
         
-        for match in ansi_pattern.finditer(text):
+        for match in self._ANSI_PARSE_RE.finditer(text):
             # Add text before this code
             if match.start() > current_pos:
-                segments.append((text[current_pos:match.start()], current_tags.copy()))
+                segments.append((text[current_pos:match.start()], current_tags))
             
             # Parse ANSI code
             codes = match.group(1).split(';')
             for code in codes:
                 if code == '0':  # Reset
-                    current_tags = []
-                elif code in self.ANSI_COLORS:
-                    current_tags.append(f'ansi_{code}')
+                    current_tags = ()
+                else:
+                    tag = self._ANSI_TAG.get(code)
+                    if tag:
+                        current_tags += (tag,)
             
             current_pos = match.end()
         
         # Add remaining text
         if current_pos < len(text):
-            segments.append((text[current_pos:], current_tags.copy()))
+            segments.append((text[current_pos:], current_tags))
         
-        return segments if segments else [(text, [])]
+        return segments if segments else [(text, ())]
     
-    def write(self, text: str, tag: str = 'stdout', add_timestamp: bool = False):
-        """Write text to terminal with optional tag."""
-        self.text_widget.configure(state='normal')
-        
+    def _chunks(self, text: str, tag: str, add_timestamp: bool) -> list:
+        """Build the (text, tags, ...) arguments that insert one line."""
+        chunks = []
         if add_timestamp:
             timestamp = datetime.now().strftime('%H:%M:%S')
-            self.text_widget.insert(tk.END, f"[{timestamp}] ", 'timestamp')
+            chunks += (f"[{timestamp}] ", 'timestamp')
         
         # Check for ANSI codes
-        if '\x1B[' in text:
-            segments = self._parse_ansi_text(text)
-            for segment_text, ansi_tags in segments:
-                tags = [tag] + ansi_tags
-                self.text_widget.insert(tk.END, segment_text, tuple(tags))
+        if _ESC in text:
+            for segment_text, ansi_tags in self._parse_ansi_text(text):
+                chunks += (segment_text, (tag, *ansi_tags))
         else:
-            self.text_widget.insert(tk.END, text, tag)
+            chunks += (text, tag)
         
-        self.text_widget.insert(tk.END, '\n')
+        chunks += ('\n', ())
+        return chunks
+    
+    def _insert(self, chunks: list):
+        """Append chunks to the terminal with a single Text insert."""
+        self.text_widget.configure(state='normal')
+        self.text_widget.insert(tk.END, *chunks)
         
-        # Auto-scroll
-        if self.autoscroll_var.get():
-            self.text_widget.see(tk.END)
+        # Auto-scroll, at most once per idle tick
+        if self.autoscroll_var.get() and not self._scroll_pending:
+            self._scroll_pending = True
+            self.after_idle(self._do_scroll)
         
         self.text_widget.configure(state='disabled')
     
+    def _do_scroll(self):
+        """Scroll to the end of the output."""
+        self._scroll_pending = False
+        self.text_widget.see(tk.END)
+    
+    def write(self, text: str, tag: str = 'stdout', add_timestamp: bool = False):
+        """Write text to terminal with optional tag."""
+        # Keep buffered stream output ahead of this line
+        if self._pending:
+            self._flush_pending()
+        self._insert(self._chunks(text, tag, add_timestamp))
+    
+    def _enqueue(self, text: str, tag: str):
+        """Buffer a stream line; lines arriving before the next idle tick are written together."""
+        with self._pending_lock:
+            self._pending.append((text, tag))
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        self.after_idle(self._flush_pending)
+    
+    def _flush_pending(self):
+        """Write all buffered stream lines in one insert."""
+        with self._pending_lock:
+            batch, self._pending = self._pending, []
+            self._flush_scheduled = False
+        if batch:
+            chunks = []
+            for text, tag in batch:
+                chunks += self._chunks(text, tag, False)
+            self._insert(chunks)
+    
     def write_stdout(self, text: str):
         """Write stdout text."""
-        self.write(text, 'stdout', add_timestamp=False)
+        self._enqueue(text, 'stdout')
     
     def write_stderr(self, text: str):
         """Write stderr text."""
-        self.write(text, 'stderr', add_timestamp=False)
+        self._enqueue(text, 'stderr')
     
     def write_info(self, text: str):
         """Write info message."""
@@ -188,6 +248,8 @@ class TerminalWidget(ctk.CTkFrame):
     
     def clear(self):
         """Clear terminal output."""
+        with self._pending_lock:
+            self._pending = []
         self.text_widget.configure(state='normal')
         self.text_widget.delete('1.0', tk.END)
         self.text_widget.configure(state='disabled')
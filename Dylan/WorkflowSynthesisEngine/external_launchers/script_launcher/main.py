@@ -8,7 +8,8 @@ A production-ready Python script launcher with GUI, CLI, and API interfaces.
 import sys
 from pathlib import Path
 
-# Add project root to path
+# Add project root to path; core, api, cli and gui are imported as
+# top-level packages from here
 sys.path.insert(0, str(Path(__file__).parent))
 
 from cli import cli
@@ -8,14 +8,18 @@ import json
 import sys
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[3]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+try:
+    import uvloop  # Faster event loop where available (not on Windows)
+except ImportError:
+    uvloop = None
 
-from cesar_src.cli.extract import _run as run_workflow
+ROOT = Path(__file__).resolve().parents[3]
 
 
 async def _execute(config: Path, transcript: Path, endpoint: str | None) -> dict:
+    # Imported here so --help and bad paths don't load the whole engine
+    from cesar_src.cli.extract import _run as run_workflow
+
     return await run_workflow(config, transcript, endpoint)
 
 
@@ -31,9 +35,17 @@ def main() -> None:
     if not args.transcript.exists():
         raise FileNotFoundError(f"Transcript not found: {args.transcript}")
 
-    result = asyncio.run(_execute(args.config, args.transcript, args.endpoint))
+    run = asyncio.run
+    if uvloop is not None:
+        if hasattr(uvloop, "run"):
+            run = uvloop.run
+        else:
+            uvloop.install()  # uvloop < 0.18 has no run(); use its loop policy
+    result = run(_execute(args.config, args.transcript, args.endpoint))
     print(json.dumps(result, indent=2))
 
 
 if __name__ == "__main__":
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
     main()
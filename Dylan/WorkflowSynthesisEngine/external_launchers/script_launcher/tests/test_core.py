@@ -2,16 +2,24 @@
 Test script to verify core functionality.
 """
 
+import os
+import subprocess
 import sys
+import tempfile
+from datetime import datetime, timezone
 from pathlib import Path
 
+import msgpack
+import orjson
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core import (
     get_registry, get_engine, get_logger,
-    ScriptMetadata, ScriptParameter, ParameterManager
+    ScriptMetadata, ScriptParameter, ParameterManager, OutputStreamHandler
 )
+from core.scheduler import ScriptScheduler
 
 logger = get_logger(__name__)
 
@@ -89,6 +97,149 @@ def test_parameter_manager():
     logger.info("✓ Parameter manager test passed")
 
 
+def test_registry_indexes():
+    """Test that the registry's derived indexes follow register, update and unregister."""
+    logger.info("Testing registry indexes...")
+    
+    registry = get_registry()
+    
+    metadata = ScriptMetadata(
+        id="",
+        name="Index Probe",
+        path=str(Path(__file__).parent / "index_probe.py"),
+        description="Probe for index consistency",
+        tags=["probe-old", "probe-shared"]
+    )
+    
+    version = registry.version()
+    script_id = registry.register_script(metadata)
+    assert registry.version() > version, "Version not bumped on register"
+    assert script_id in registry._by_tag["probe-old"], "Tag index missing new script"
+    assert "index probe" in registry._haystacks[script_id], "Search index missing new script"
+    assert registry._dict_cache[script_id] == metadata.to_dict(), "Dict cache out of date"
+    
+    # Re-registering the same path updates it in place
+    updated = ScriptMetadata(
+        id="",
+        name="Index Probe Renamed",
+        path=metadata.path,
+        description="Probe for index consistency",
+        tags=["probe-new", "probe-shared"]
+    )
+    version = registry.version()
+    assert registry.register_script(updated) == script_id, "Update changed the script ID"
+    assert registry.version() > version, "Version not bumped on update"
+    assert "probe-old" not in registry._by_tag, "Stale tag left in index"
+    assert [s.id for s in registry.get_scripts_by_tag("probe-new")] == [script_id], "New tag not indexed"
+    assert [s.id for s in registry.search_scripts("renamed")] == [script_id], "Search index not updated"
+    assert registry._dict_cache[script_id] == updated.to_dict(), "Dict cache not updated"
+    
+    version = registry.version()
+    assert registry.unregister_script(script_id), "Unregister failed"
+    assert registry.version() > version, "Version not bumped on unregister"
+    assert "probe-new" not in registry._by_tag and "probe-shared" not in registry._by_tag, "Tags left after unregister"
+    assert script_id not in registry._haystacks, "Search entry left after unregister"
+    assert script_id not in registry._dict_cache, "Dict cache entry left after unregister"
+    
+    logger.info("✓ Registry index test passed")
+
+
+def test_validate_parameters():
+    """Test that batch validation matches validating each parameter on its own."""
+    logger.info("Testing batch parameter validation...")
+    
+    param_manager = ParameterManager()
+    parameters = [
+        ScriptParameter(name="count", type="int", description="Count", min_value=0, max_value=10),
+        ScriptParameter(name="ratio", type="float", description="Ratio", default=0.5),
+        ScriptParameter(name="mode", type="choice", description="Mode", choices=["fast", "slow"]),
+        ScriptParameter(name="verbose", type="bool", description="Verbose")
+    ]
+    values = {"count": "7", "mode": "slow", "verbose": "yes"}
+    
+    def one_by_one():
+        return {p.name: param_manager.validate_parameter(p, values.get(p.name)) for p in parameters}
+    
+    assert param_manager.validate_parameters(parameters, values) == one_by_one(), "Batch validation differs"
+    
+    # A renamed parameter is picked up on the next call
+    parameters[0].name = "total"
+    values["total"] = values.pop("count")
+    assert param_manager.validate_parameters(parameters, values) == one_by_one(), "Rename not picked up"
+    
+    logger.info("✓ Batch parameter validation test passed")
+
+
+def test_schedule_migration():
+    """Test that legacy schedules.json is loaded and rewritten as schedules.msgpack."""
+    logger.info("Testing schedule migration...")
+    
+    home = os.environ.get("HOME")
+    os.environ["HOME"] = tempfile.mkdtemp()
+    try:
+        config_dir = Path.home() / "script_launcher" / "config"
+        config_dir.mkdir(parents=True)
+        legacy_job = {
+            "job_id": "legacy",
+            "name": "Legacy Job",
+            "script_id": "missing",
+            "parameters": {},
+            "trigger_type": "interval",
+            "trigger_args": {"hours": 1},
+            "created_at": "2025-01-01T00:00:00"
+        }
+        (config_dir / "schedules.json").write_bytes(orjson.dumps({"legacy": legacy_job}))
+        
+        # Legacy naive local timestamps are rewritten in UTC on load
+        legacy_job["created_at"] = datetime(2025, 1, 1).astimezone(timezone.utc).isoformat(timespec="seconds")
+        
+        # A fresh instance rather than the shared one, so it reads the temp config
+        scheduler = object.__new__(ScriptScheduler)
+        scheduler._init()
+        assert scheduler.scheduled_jobs["legacy"] == legacy_job, "Legacy schedule not loaded"
+        
+        scheduler.schedule_interval("fresh", "Fresh Job", "missing", {}, minutes=5)
+        assert scheduler.scheduled_jobs["fresh"]["created_at"].endswith("+00:00"), "created_at not UTC"
+        
+        # A batch shares one timestamp, and an invalid batch adds nothing
+        batch = [
+            {"job_id": f"batch{i}", "name": f"Batch {i}", "script_id": "missing",
+             "trigger_type": "interval", "trigger_args": {"minutes": i + 1}}
+            for i in range(2)
+        ]
+        assert scheduler.schedule_batch(batch) == ["batch0", "batch1"], "Batch not scheduled"
+        stamps = {scheduler.scheduled_jobs[job["job_id"]]["created_at"] for job in batch}
+        assert len(stamps) == 1, "Batch jobs stamped separately"
+        bad_batch = [dict(batch[0], job_id="ok"), dict(batch[1], job_id="bad", trigger_type="weekly")]
+        try:
+            scheduler.schedule_batch(bad_batch)
+            assert False, "Invalid batch accepted"
+        except ValueError:
+            pass
+        assert "ok" not in scheduler.scheduled_jobs, "Partial batch scheduled"
+        for job in batch:
+            scheduler.unschedule(job["job_id"])
+        scheduler.shutdown()
+        
+        saved = msgpack.unpackb((config_dir / "schedules.msgpack").read_bytes())
+        assert set(saved) == {"legacy", "fresh"}, "Migrated schedules not saved as msgpack"
+        assert saved["legacy"] == legacy_job, "Legacy schedule changed during migration"
+        
+        # The msgpack file now takes precedence over the legacy one
+        (config_dir / "schedules.json").write_bytes(orjson.dumps({}))
+        reloaded = object.__new__(ScriptScheduler)
+        reloaded._init()
+        assert set(reloaded.scheduled_jobs) == {"legacy", "fresh"}, "msgpack schedules not reloaded"
+        reloaded.shutdown()
+    finally:
+        if home is None:
+            os.environ.pop("HOME", None)
+        else:
+            os.environ["HOME"] = home
+    
+    logger.info("✓ Schedule migration test passed")
+
+
 def test_launcher_engine(script_id):
     """Test launcher engine."""
     logger.info("Testing launcher engine...")
@@ -112,6 +263,34 @@ def test_launcher_engine(script_id):
     logger.info("✓ Launcher engine test passed")
 
 
+def test_output_spill():
+    """Test that lines evicted from the in-memory tail spill to disk and back."""
+    logger.info("Testing output spill...")
+    
+    process = subprocess.Popen(
+        [sys.executable, "-c", "for i in range(25): print(f'line {i}')"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE
+    )
+    handler = OutputStreamHandler(process, max_lines=10, queue_output=False)
+    process.wait()
+    handler.join(timeout=5)
+    
+    # Only the newest lines stay in memory; the rest went to the spill file
+    assert len(handler.stdout_lines) == 10, "In-memory tail not bounded"
+    assert handler.stdout_lines[0] == "line 15", "Wrong lines evicted"
+    
+    stdout, stderr = handler.get_full_output()
+    expected = "\n".join(f"line {i}" for i in range(25))
+    assert stdout == expected, "Spilled output did not round-trip"
+    assert stderr == "", "Unexpected stderr"
+    
+    handler.close()
+    assert not handler._spill, "Spill files not released on close"
+    
+    logger.info("✓ Output spill test passed")
+
+
 def main():
     """Run all tests."""
     logger.info("=" * 60)
@@ -120,8 +299,12 @@ def main():
     
     try:
         script_id = test_registry()
+        test_registry_indexes()
         test_parameter_manager()
+        test_validate_parameters()
+        test_schedule_migration()
         test_launcher_engine(script_id)
+        test_output_spill()
         
         logger.info("=" * 60)
         logger.info("✓ All tests passed!")
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import socket
 import subprocess
 import sys
 import time
@@ -11,6 +12,23 @@ from pathlib import Path
 
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 8000
+STARTUP_TIMEOUT = 10.0
+
+
+def _wait_for_server(proc: subprocess.Popen, host: str, port: int, timeout: float = STARTUP_TIMEOUT) -> bool:
+    """Poll until the server accepts connections; False if it exits or times out."""
+    # A wildcard bind is reachable on loopback
+    probe_host = {"0.0.0.0": "127.0.0.1", "::": "::1"}.get(host, host)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            return False
+        try:
+            socket.create_connection((probe_host, port), timeout=0.1).close()
+            return True
+        except OSError:
+            time.sleep(0.05)
+    return False
 
 
 def main() -> None:
@@ -32,7 +50,10 @@ def main() -> None:
     proc = subprocess.Popen(uvicorn_cmd)
 
     url = f"http://{args.host}:{args.port}/"
-    time.sleep(1.0)
+    if not _wait_for_server(proc, args.host, args.port):
+        if proc.poll() is not None:
+            sys.exit(proc.returncode)
+        print(f"Server not reachable after {STARTUP_TIMEOUT:.0f}s; still waiting on it")
     if not args.no_browser:
         webbrowser.open(url)
         print(f"Browser opened at {url}")